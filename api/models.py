@@ -5,8 +5,9 @@ Based on PRD specifications with PostgreSQL and future multi-tenant support
 
 from sqlalchemy import (
     Column, String, Integer, Text, DateTime, Float, 
-    ForeignKey, Enum, Boolean, Index, JSON, LargeBinary
+    ForeignKey, Enum, Boolean, Index, LargeBinary, DDL, event
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -167,7 +168,7 @@ class Run(Base):
     error = Column(Text)
     
     # Metadata
-    metadata = Column(JSON)  # For additional tracking data
+    metadata = Column(JSONB)  # For additional tracking data
     
     # Relationships
     case = relationship("Case", back_populates="runs")
@@ -178,7 +179,8 @@ class Run(Base):
     # Indexes
     __table_args__ = (
         Index('idx_run_case_status', 'case_id', 'status'),
-        Index('idx_run_created', 'created_at'),
+        Index('idx_run_created', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        Index('idx_run_case_created', case_id, created_at.desc()),
     )
     
     def __repr__(self):
@@ -222,6 +224,7 @@ class Document(Base):
     __table_args__ = (
         Index('idx_doc_sha256', 'sha256'),
         Index('idx_doc_run_status', 'run_id', 'status'),
+        Index('idx_doc_case', 'case_id'),
     )
     
     def calculate_sha256(self, file_content: bytes) -> str:
@@ -236,8 +239,9 @@ class Event(Base):
     """Extracted legal event"""
     __tablename__ = "events"
     
-    id = Column(Integer, primary_key=True)
-    run_id = Column(Integer, ForeignKey("runs.id", ondelete="CASCADE"), nullable=False)
+    # Hash-partitioned by run_id; the primary key must include the partition key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(Integer, ForeignKey("runs.id", ondelete="CASCADE"), primary_key=True)
     document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     
     # Five-column structure
@@ -257,9 +261,11 @@ class Event(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_event_run', 'run_id'),
+        Index('idx_event_run_number', 'run_id', 'number'),
         Index('idx_event_document', 'document_id'),
         Index('idx_event_date', 'date'),
+        Index('idx_event_created', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        {'postgresql_partition_by': 'HASH (run_id)'},
     )
     
     def to_dict(self):
@@ -276,6 +282,21 @@ class Event(Base):
         return f"<Event {self.number} from {self.document_reference}>"
 
 
+# Number of events hash partitions (keep in sync with migration 005_partition_events)
+EVENT_PARTITIONS = 8
+
+# create_all() only creates the partitioned parent; rows need partitions to land in
+for _remainder in range(EVENT_PARTITIONS):
+    event.listen(
+        Event.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE events_p{_remainder} PARTITION OF events "
+            f"FOR VALUES WITH (MODULUS {EVENT_PARTITIONS}, REMAINDER {_remainder})"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
 class Artifact(Base):
     """Generated export files (CSV, XLSX, JSON)"""
     __tablename__ = "artifacts"
@@ -314,7 +335,7 @@ class ModelCatalog(Base):
     supports_vision = Column(Boolean, default=False)
     
     # Metadata
-    badges = Column(JSON)  # ["recommended", "fast", "quality", etc.]
+    badges = Column(JSONB)  # ["recommended", "fast", "quality", etc.]
     status = Column(String(20), default="stable")  # stable, experimental, deprecated
     is_recommended = Column(Boolean, default=False)
     
@@ -7,12 +7,19 @@ import os
 import logging
 from typing import Optional, BinaryIO
 from datetime import timedelta
+import certifi
+import urllib3
+from urllib3.util import Retry, Timeout
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections per host; sized for concurrent document processing and cleanup
+HTTP_POOL_MAXSIZE = 32
+
 
 class MinioStorage:
     """
@@ -27,12 +34,24 @@ class MinioStorage:
         self.bucket = os.getenv("MINIO_BUCKET", "legal-documents")
         self.secure = os.getenv("MINIO_SECURE", "false").lower() == "true"
         
+        # Connection pool shared by every call on this client (and across threads).
+        # Timeouts, retries and CA bundle follow the minio defaults; only the pool is larger.
+        self.http_client = urllib3.PoolManager(
+            num_pools=8,
+            maxsize=HTTP_POOL_MAXSIZE,
+            timeout=Timeout(connect=300, read=300),
+            cert_reqs='CERT_REQUIRED',
+            ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+            retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
+        )
+        
         # Initialize client
         self.client = Minio(
             self.endpoint,
             access_key=self.access_key,
             secret_key=self.secret_key,
-            secure=self.secure
+            secure=self.secure,
+            http_client=self.http_client
         )
         
         logger.info(f"📦 MinIO client initialized for {self.endpoint}")
@@ -231,6 +250,31 @@ class MinioStorage:
             logger.error(f"Failed to download bytes: {e}")
             return None
     
+    def download_bytes_if_exists(self, object_name: str) -> Optional[bytes]:
+        """
+        Download object as bytes, treating a missing object as a normal miss
+        
+        Args:
+            object_name: Object key
+            
+        Returns:
+            Bytes if the object exists, None otherwise
+        """
+        try:
+            response = self.client.get_object(self.bucket, object_name)
+        except S3Error as e:
+            if e.code != "NoSuchKey":
+                logger.error(f"Failed to download bytes: {e}")
+            return None
+        
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+        logger.debug(f"Downloaded {len(data)} bytes from {object_name}")
+        return data
+    
     def delete_object(self, object_name: str) -> bool:
         """
         Delete an object from MinIO
@@ -249,6 +293,38 @@ class MinioStorage:
             logger.error(f"Failed to delete object: {e}")
             return False
     
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every object under a prefix using multi-object delete requests
+        
+        Args:
+            prefix: Object key prefix
+            
+        Returns:
+            Number of objects deleted
+        """
+        object_names = self.list_objects(prefix)
+        if not object_names:
+            return 0
+        
+        try:
+            # remove_objects sends up to 1000 keys per request; errors are yielded lazily
+            errors = self.client.remove_objects(
+                self.bucket,
+                (DeleteObject(name) for name in object_names)
+            )
+            failed = 0
+            for error in errors:
+                logger.error(f"Failed to delete {error.name}: {error.message}")
+                failed += 1
+        except S3Error as e:
+            logger.error(f"Failed to delete objects under {prefix}: {e}")
+            return 0
+        
+        deleted = len(object_names) - failed
+        logger.info(f"✅ Deleted {deleted} objects under {prefix}")
+        return deleted
+    
     def list_objects(self, prefix: str) -> list:
         """
         List objects with a given prefix
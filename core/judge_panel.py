@@ -7,6 +7,7 @@ consensus evaluation with inter-judge agreement analysis.
 """
 
 import os
+import asyncio
 import logging
 import statistics
 from typing import List, Dict, Any, Tuple
@@ -18,7 +19,7 @@ import json
 from .judges.gpt5_judge import GPT5Judge
 from .judges.claude_opus_judge import ClaudeOpusJudge
 from .judges.gemini_pro_judge import GeminiProJudge
-from .judges.base_judge import JudgeResult, ProviderScore
+from .judges.base_judge import BaseJudge, JudgeResult, ProviderScore
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +159,52 @@ class JudgePanel:
         # Run judges in parallel
         individual_results = self._run_judges_parallel(document_name, provider_outputs)
 
+        return self._build_panel_result(document_name, provider_outputs, individual_results)
+
+    async def run(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> PanelResult:
+        """
+        Async variant of judge_document for callers already on an event loop.
+
+        The judge prompt is built once and shared by every judge, and all judges
+        are dispatched with a single asyncio.gather.
+
+        Args:
+            document_name: Name of the document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+
+        Returns:
+            PanelResult with individual results, consensus, and agreement analysis
+        """
+        logger.info(f"🎯 3-JUDGE PANEL EVALUATION (async): {document_name}")
+
+        prompt = self.judges[0]._get_judge_prompt(document_name, provider_outputs)
+
+        outcomes = await asyncio.gather(
+            *(judge.judge_providers_async(document_name, provider_outputs, prompt) for judge in self.judges),
+            return_exceptions=True
+        )
+
+        individual_results = {}
+        for judge, outcome in zip(self.judges, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ {judge.__class__.__name__} failed: {outcome}")
+                continue
+            individual_results[outcome.judge_name] = outcome
+            logger.info(f"✅ {outcome.judge_name} completed - winner: {outcome.winner}")
+
+        return self._build_panel_result(document_name, provider_outputs, individual_results)
+
+    def _build_panel_result(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        individual_results: Dict[str, JudgeResult]
+    ) -> PanelResult:
+        """Aggregate individual judge results into consensus, agreement, and cost totals"""
         # Calculate consensus scores
         consensus_scores = self._calculate_consensus_scores(individual_results, provider_outputs)
 
@@ -198,9 +245,12 @@ class JudgePanel:
         """Run all judges in parallel using ThreadPoolExecutor"""
         results = {}
 
+        # The prompt is identical for every judge, so build it once
+        prompt = self.judges[0]._get_judge_prompt(document_name, provider_outputs)
+
         with ThreadPoolExecutor(max_workers=len(self.judges)) as executor:
             futures = {
-                executor.submit(judge.judge_providers, document_name, provider_outputs): judge
+                executor.submit(judge.judge_providers, document_name, provider_outputs, prompt): judge
                 for judge in self.judges
             }
 
@@ -7,9 +7,19 @@ across GPT-5, Claude Opus 4.1, and Gemini 2.5 Pro.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, fields
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import asyncio
+import json
 import logging
+import os
+import random
+import threading
+import time
+
+from .verdict_cache import VerdictCache
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +46,116 @@ class JudgeResult:
     document_name: str
     provider_scores: List[ProviderScore]
     winner: str  # Provider with highest overall quality
-    timestamp: str
+    timestamp_ns: int  # Wall-clock time from time.time_ns()
     cost: float  # Judging cost in USD
     thinking_tokens: int = 0  # Reasoning tokens used (for GPT-5, Claude)
 
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 local time, formatted on demand for reports/exports"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
+
+
+# Numeric score fields in ProviderScore, read straight from each judge's JSON
+_SCORE_KEYS = tuple(f.name for f in fields(ProviderScore) if f.type is float)
+
+# JSON schema every judge response must satisfy (enforced provider-side via
+# structured outputs / tool use / response_schema)
+_SCORES_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "providers": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "provider": {"type": "string"},
+                    **{key: {"type": "number"} for key in _SCORE_KEYS},
+                    "reasoning": {"type": "string"}
+                },
+                "required": ["provider", *_SCORE_KEYS, "reasoning"],
+                "additionalProperties": False
+            }
+        },
+        "winner": {"type": "string"}
+    },
+    "required": ["providers", "winner"],
+    "additionalProperties": False
+}
+
+
+# Static judge prompt sections; provider outputs are inserted between them
+_JUDGE_PROMPT_HEADER = """You are an expert legal document analyst evaluating the quality of automated legal event extraction systems. You will compare the outputs of multiple AI providers that extracted legal events from the same document.
+
+**Document**: {document_name}
+
+**Your Task**: Score each provider on 5 criteria (0-10 scale) and identify the best provider.
+
+**Scoring Criteria** (calibrated for legal professional needs):
+
+1. **Completeness** (0-10): Did the provider capture all meaningful legal events?
+   - 10 = All events captured, no important events missed
+   - 5 = About half the events captured
+   - 0 = Very few or no events captured
+   - NOTE: High completeness with missing citations should NOT score 10 overall
+
+2. **Accuracy** (0-10): Are the dates, parties, facts, and details correct?
+   - 10 = All facts accurate, no errors
+   - 5 = Some errors but mostly correct
+   - 0 = Many errors or completely wrong
+
+3. **Hallucinations** (0-10): Are there invented facts NOT in the source?
+   - 10 = No hallucinations, all facts from source
+   - 5 = Minor invented details
+   - 0 = Many fabricated facts
+
+4. **Citation Quality** (0-10): Are legal citations accurate and properly formatted?
+   - 10 = All citations accurate and well-formatted
+   - 5 = Some citation errors or missing citations
+   - 0 = No citations or completely wrong citations
+   - **CRITICAL FOR LEGAL WORK**: Missing citations is a fatal flaw (max 5/10 overall)
+
+5. **Overall Quality** (0-10): Overall usability for legal professionals
+   - 10 = Production-ready, no corrections needed (requires proper citations)
+   - 5 = Usable with moderate corrections
+   - 0 = Not usable, requires complete rewrite
+   - **Consider**: Legal professionals need QUALITY over QUANTITY
+   - **Prefer**: 1 well-cited event over 5 events without citations
+   - **Fatal flaws**: Missing citations, hallucinations, poor accuracy
+
+**Provider Outputs**:
+
+"""
+
+_JUDGE_PROMPT_FOOTER = """
+**Output Format**: Return ONLY valid JSON with this exact structure:
+
+{
+  "providers": [
+    {
+      "provider": "provider_name",
+      "completeness": 8.5,
+      "accuracy": 9.0,
+      "hallucinations": 10.0,
+      "citation_quality": 7.5,
+      "overall_quality": 8.5,
+      "reasoning": "Brief explanation of scores (2-3 sentences)"
+    }
+  ],
+  "winner": "provider_name"
+}
+
+**Important Judging Guidelines**:
+- Score ALL providers objectively
+- Use decimal scores (e.g., 8.5) for precision
+- Winner = highest overall_quality score
+- **Citation quality is CRITICAL**: Providers with missing/poor citations cannot score >7/10 overall
+- **Quality over quantity**: 1 well-cited event beats 5 events without citations
+- **Legal professional context**: Prioritize usability for lawyers (citations, accuracy, no hallucinations)
+- Reasoning should explain key strengths/weaknesses (2-3 sentences)
+- Return ONLY the JSON, no other text
+"""
+
 
 class BaseJudge(ABC):
     """
@@ -53,7 +169,21 @@ class BaseJudge(ABC):
     - Overall Quality (0-10)
     """
 
-    def __init__(self, api_key: str, model: str, temperature: float = 0.0):
+    # Short identifier reported in JudgeResult.judge_name (set by subclasses)
+    judge_name: str = ""
+
+    # Built prompts keyed by content hash, shared by every judge instance (LRU)
+    _PROMPT_CACHE_SIZE = 32
+    _prompt_cache: "OrderedDict[str, str]" = OrderedDict()
+    _prompt_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        temperature: float = 0.0,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize judge with API credentials
 
@@ -61,6 +191,8 @@ class BaseJudge(ABC):
             api_key: API key for the model provider
             model: Model identifier (e.g., "gpt-5", "claude-opus-4-1")
             temperature: Temperature for generation (0.0 for consistency)
+            cache_dir: Directory for cached verdicts (defaults to JUDGE_CACHE_DIR env var,
+                caching disabled when neither is set)
         """
         self.api_key = api_key
         self.model = model
@@ -69,17 +201,23 @@ class BaseJudge(ABC):
         if not self.api_key:
             raise ValueError(f"API key required for {self.__class__.__name__}")
 
+        cache_dir = cache_dir or os.getenv("JUDGE_CACHE_DIR")
+        self.cache = VerdictCache(cache_dir) if cache_dir else None
+
         logger.info(f"{self.__class__.__name__} initialized with model: {model}")
 
-    @abstractmethod
     def judge_providers(
         self,
         document_name: str,
-        provider_outputs: Dict[str, List[Dict[str, Any]]]
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        prompt: Optional[str] = None
     ) -> JudgeResult:
         """
         Evaluate all provider outputs for a single document.
 
+        Identical (document, provider_outputs, judge, model, temperature) requests
+        are served from the verdict cache when one is configured.
+
         Args:
             document_name: Name of the document being evaluated
             provider_outputs: Dict mapping provider names to list of extracted events
@@ -87,17 +225,198 @@ class BaseJudge(ABC):
                     "openai": [{"date": "...", "event_particulars": "...", "citation": "..."}],
                     "openrouter": [...]
                 }
+            prompt: Prebuilt judge prompt (from _build_judge_prompt) to share across judges
 
         Returns:
             JudgeResult with scores for all providers and winner selection
         """
-        pass
+        logger.info(f"{self.__class__.__name__} evaluating document: {document_name}")
+        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = VerdictCache.make_key(
+                document_name, provider_outputs, self.judge_name, self.model, self.temperature
+            )
+            cached = self._load_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"💾 {self.judge_name} verdict for {document_name} served from cache")
+                return cached
+
+        # Build standardized prompt (unless the panel already built it)
+        if prompt is None:
+            prompt = self._get_judge_prompt(document_name, provider_outputs)
+
+        # Call judge model API (transient failures are retried)
+        response_text = self._call_api_with_retry(prompt)
+
+        # Parse response
+        result = json.loads(response_text)
+
+        # Build ProviderScore objects
+        provider_scores = [
+            self._make_provider_score(provider_data, document_name, provider_outputs)
+            for provider_data in result.get("providers", [])
+        ]
+
+        # Cost and thinking tokens recorded by _call_api
+        cost = getattr(self, '_last_cost', 0.0)
+        thinking_tokens = getattr(self, '_last_thinking_tokens', 0)
+
+        judge_result = JudgeResult(
+            judge_name=self.judge_name,
+            model=self.model,
+            document_name=document_name,
+            provider_scores=provider_scores,
+            winner=result["winner"],
+            timestamp_ns=time.time_ns(),
+            cost=cost,
+            thinking_tokens=thinking_tokens
+        )
+
+        logger.info(f"{self.judge_name} winner for {document_name}: {judge_result.winner}")
+        logger.info(f"{self.judge_name} thinking tokens: {thinking_tokens}, cost: ${cost:.4f}")
+
+        if cache_key is not None:
+            self.cache.set(cache_key, asdict(judge_result))
+
+        return judge_result
+
+    async def judge_providers_async(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        prompt: Optional[str] = None
+    ) -> JudgeResult:
+        """
+        Async wrapper around judge_providers
+
+        The provider SDK clients are synchronous, so the call runs in a worker thread.
+
+        Args:
+            document_name: Name of the document being evaluated
+            provider_outputs: Dict mapping provider names to list of extracted events
+            prompt: Prebuilt judge prompt to share across judges
+
+        Returns:
+            JudgeResult with scores for all providers and winner selection
+        """
+        return await asyncio.to_thread(self.judge_providers, document_name, provider_outputs, prompt)
+
+    @staticmethod
+    def _make_provider_score(
+        provider_data: Dict[str, Any],
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> ProviderScore:
+        """
+        Build a ProviderScore from one entry of the judge's "providers" array
+
+        Args:
+            provider_data: Parsed provider entry from the judge response
+            document_name: Name of the document being evaluated
+            provider_outputs: Provider outputs that were judged (for event counts)
+
+        Returns:
+            ProviderScore for the provider
+        """
+        provider = provider_data["provider"]
+        return ProviderScore(
+            provider=provider,
+            document_name=document_name,
+            reasoning=provider_data["reasoning"],
+            event_count=len(provider_outputs.get(provider, ())),
+            # Not every provider validates tool input against the schema, so "8.5" or 8 can arrive
+            **{key: float(provider_data[key]) for key in _SCORE_KEYS}
+        )
+
+    def _load_cached_result(self, cache_key: str) -> Optional[JudgeResult]:
+        """
+        Rebuild a JudgeResult from a cached verdict
+
+        Args:
+            cache_key: Verdict cache key
+
+        Returns:
+            JudgeResult, or None on miss or stale/corrupt entry
+        """
+        data = self.cache.get(cache_key)
+        if data is None:
+            return None
+
+        try:
+            data["provider_scores"] = [ProviderScore(**s) for s in data["provider_scores"]]
+            # Nothing was billed for this evaluation
+            data["cost"] = 0.0
+            return JudgeResult(**data)
+        except (KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Discarding stale judge cache entry: {e}")
+            return None
+
+    def _call_api_with_retry(
+        self,
+        prompt: str,
+        max_retries: int = 4,
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0
+    ) -> str:
+        """
+        Call _call_api, retrying transient failures with jittered exponential backoff
+
+        Judge calls are expensive, so a single 429/5xx should not abort an evaluation.
+        Full jitter keeps the panel's concurrent judges from retrying in lockstep.
+
+        Args:
+            prompt: The judge evaluation prompt
+            max_retries: Maximum number of retry attempts
+            initial_delay: Base delay in seconds before the first retry
+            max_delay: Upper bound on the backoff delay in seconds
+
+        Returns:
+            JSON string with provider scores
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any non-retryable error
+        """
+        delay = initial_delay
+
+        for attempt in range(max_retries + 1):
+            try:
+                return self._call_api(prompt)
+            except Exception as e:
+                if attempt >= max_retries or not self._is_retryable(e):
+                    raise
+
+                sleep_for = random.uniform(0, min(delay, max_delay))
+                logger.warning(
+                    f"⚠️ {self.judge_name} transient error ({type(e).__name__}), retrying in {sleep_for:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries + 1})"
+                )
+                time.sleep(sleep_for)
+                delay *= 2
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        """
+        Whether an API error is transient (rate limit, timeout, connection, 5xx)
+
+        Subclasses map their SDK's exception types; the default retries nothing.
+
+        Args:
+            exc: Exception raised by _call_api
+
+        Returns:
+            True if the call should be retried
+        """
+        return False
 
     @abstractmethod
     def _call_api(self, prompt: str) -> str:
         """
         Make API call to the judge model.
 
+        Implementations record usage on the instance as ``_last_cost`` (USD) and,
+        where available, ``_last_thinking_tokens`` for judge_providers to report.
+
         Args:
             prompt: The judge evaluation prompt
 
@@ -106,13 +425,16 @@ class BaseJudge(ABC):
         """
         pass
 
-    def _build_judge_prompt(
+    def _get_judge_prompt(
         self,
         document_name: str,
         provider_outputs: Dict[str, List[Dict[str, Any]]]
     ) -> str:
         """
-        Build standardized judge prompt (same across all judges).
+        Return the judge prompt, reusing one already built for identical inputs.
+
+        The prompt depends only on the document and provider outputs, so judges
+        evaluating the same document share a single build.
 
         Args:
             document_name: Name of the document being evaluated
@@ -121,89 +443,58 @@ class BaseJudge(ABC):
         Returns:
             Formatted prompt for the judge
         """
-        prompt = f"""You are an expert legal document analyst evaluating the quality of automated legal event extraction systems. You will compare the outputs of multiple AI providers that extracted legal events from the same document.
-
-**Document**: {document_name}
+        builder = type(self)._build_judge_prompt
+        key = VerdictCache.make_key(builder.__qualname__, document_name, provider_outputs)
+        cache = BaseJudge._prompt_cache
 
-**Your Task**: Score each provider on 5 criteria (0-10 scale) and identify the best provider.
+        with BaseJudge._prompt_cache_lock:
+            prompt = cache.get(key)
+            if prompt is not None:
+                cache.move_to_end(key)
+                return prompt
 
-**Scoring Criteria** (calibrated for legal professional needs):
-
-1. **Completeness** (0-10): Did the provider capture all meaningful legal events?
-   - 10 = All events captured, no important events missed
-   - 5 = About half the events captured
-   - 0 = Very few or no events captured
-   - NOTE: High completeness with missing citations should NOT score 10 overall
-
-2. **Accuracy** (0-10): Are the dates, parties, facts, and details correct?
-   - 10 = All facts accurate, no errors
-   - 5 = Some errors but mostly correct
-   - 0 = Many errors or completely wrong
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
 
-3. **Hallucinations** (0-10): Are there invented facts NOT in the source?
-   - 10 = No hallucinations, all facts from source
-   - 5 = Minor invented details
-   - 0 = Many fabricated facts
+        with BaseJudge._prompt_cache_lock:
+            cache[key] = prompt
+            if len(cache) > BaseJudge._PROMPT_CACHE_SIZE:
+                cache.popitem(last=False)
 
-4. **Citation Quality** (0-10): Are legal citations accurate and properly formatted?
-   - 10 = All citations accurate and well-formatted
-   - 5 = Some citation errors or missing citations
-   - 0 = No citations or completely wrong citations
-   - **CRITICAL FOR LEGAL WORK**: Missing citations is a fatal flaw (max 5/10 overall)
+        return prompt
 
-5. **Overall Quality** (0-10): Overall usability for legal professionals
-   - 10 = Production-ready, no corrections needed (requires proper citations)
-   - 5 = Usable with moderate corrections
-   - 0 = Not usable, requires complete rewrite
-   - **Consider**: Legal professionals need QUALITY over QUANTITY
-   - **Prefer**: 1 well-cited event over 5 events without citations
-   - **Fatal flaws**: Missing citations, hallucinations, poor accuracy
+    def _build_judge_prompt(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> str:
+        """
+        Build standardized judge prompt (same across all judges).
 
-**Provider Outputs**:
+        Args:
+            document_name: Name of the document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
 
-"""
+        Returns:
+            Formatted prompt for the judge
+        """
+        parts = [_JUDGE_PROMPT_HEADER.format(document_name=document_name)]
+        append = parts.append
 
         # Add each provider's output
         for provider, events in provider_outputs.items():
-            prompt += f"\n**{provider.upper()}** ({len(events)} events):\n"
+            append(f"\n**{provider.upper()}** ({len(events)} events):\n")
             if not events:
-                prompt += "  (No events extracted)\n"
+                append("  (No events extracted)\n")
             else:
                 for i, event in enumerate(events, 1):
-                    prompt += f"  {i}. Date: {event.get('date', 'N/A')}\n"
-                    prompt += f"     Event: {event.get('event_particulars', 'N/A')[:200]}...\n"
-                    prompt += f"     Citation: {event.get('citation', 'N/A')}\n\n"
-
-        prompt += """
-**Output Format**: Return ONLY valid JSON with this exact structure:
-
-{
-  "providers": [
-    {
-      "provider": "provider_name",
-      "completeness": 8.5,
-      "accuracy": 9.0,
-      "hallucinations": 10.0,
-      "citation_quality": 7.5,
-      "overall_quality": 8.5,
-      "reasoning": "Brief explanation of scores (2-3 sentences)"
-    }
-  ],
-  "winner": "provider_name"
-}
-
-**Important Judging Guidelines**:
-- Score ALL providers objectively
-- Use decimal scores (e.g., 8.5) for precision
-- Winner = highest overall_quality score
-- **Citation quality is CRITICAL**: Providers with missing/poor citations cannot score >7/10 overall
-- **Quality over quantity**: 1 well-cited event beats 5 events without citations
-- **Legal professional context**: Prioritize usability for lawyers (citations, accuracy, no hallucinations)
-- Reasoning should explain key strengths/weaknesses (2-3 sentences)
-- Return ONLY the JSON, no other text
-"""
-
-        return prompt
+                    append(
+                        f"  {i}. Date: {event.get('date', 'N/A')}\n"
+                        f"     Event: {event.get('event_particulars', 'N/A')[:200]}...\n"
+                        f"     Citation: {event.get('citation', 'N/A')}\n\n"
+                    )
+
+        append(_JUDGE_PROMPT_FOOTER)
+        return "".join(parts)
 
     def is_available(self) -> bool:
         """Check if judge is properly configured and available"""
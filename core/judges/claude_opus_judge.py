@@ -8,13 +8,23 @@ for deep reasoning about legal event extraction quality.
 
 import json
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import Optional
 
-from .base_judge import BaseJudge, JudgeResult, ProviderScore
+from .base_judge import BaseJudge, _SCORES_SCHEMA
 
 logger = logging.getLogger(__name__)
 
+# Scores are returned as the input of this tool so Anthropic validates them against the schema
+_SCORES_TOOL = {
+    "name": "record_scores",
+    "description": "Record the evaluation scores for every provider and the winning provider.",
+    "input_schema": _SCORES_SCHEMA
+}
+
+
+class MissingScoresToolCall(RuntimeError):
+    """Claude answered without calling record_scores, so there is no schema-validated verdict"""
+
 
 class ClaudeOpusJudge(BaseJudge):
     """
@@ -24,12 +34,15 @@ class ClaudeOpusJudge(BaseJudge):
     Thinking appears as separate content block in response.
     """
 
+    judge_name = "claude-opus-4-1"
+
     def __init__(
         self,
         api_key: str,
         model: str = "claude-opus-4-1",
         thinking_budget: int = 10000,
-        temperature: float = 1.0  # MUST be 1.0 when thinking is enabled
+        temperature: float = 1.0,  # MUST be 1.0 when thinking is enabled
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize Claude Opus judge
@@ -39,8 +52,9 @@ class ClaudeOpusJudge(BaseJudge):
             model: Model name (default: "claude-opus-4-1")
             thinking_budget: Budget tokens for extended thinking (default: 10000)
             temperature: Temperature (must be 1.0 when thinking is enabled)
+            cache_dir: Optional verdict cache directory (see BaseJudge)
         """
-        super().__init__(api_key=api_key, model=model, temperature=temperature)
+        super().__init__(api_key=api_key, model=model, temperature=temperature, cache_dir=cache_dir)
 
         self.thinking_budget = thinking_budget
 
@@ -54,72 +68,6 @@ class ClaudeOpusJudge(BaseJudge):
 
         logger.info(f"Claude Opus Judge initialized with thinking_budget={thinking_budget}")
 
-    def judge_providers(
-        self,
-        document_name: str,
-        provider_outputs: Dict[str, List[Dict[str, Any]]]
-    ) -> JudgeResult:
-        """
-        Evaluate all provider outputs using Claude Opus with extended thinking.
-
-        Args:
-            document_name: Name of the document being evaluated
-            provider_outputs: Dict mapping provider names to list of events
-
-        Returns:
-            JudgeResult with Claude's scores and reasoning
-        """
-        logger.info(f"Claude Opus Judge evaluating document: {document_name}")
-        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
-
-        # Build standardized prompt
-        prompt = self._build_judge_prompt(document_name, provider_outputs)
-
-        # Call Anthropic API
-        response_text = self._call_api(prompt)
-
-        # Parse response
-        result = json.loads(response_text)
-
-        # Extract thinking tokens from last call
-        thinking_tokens = getattr(self, '_last_thinking_tokens', 0)
-
-        # Build ProviderScore objects
-        provider_scores = []
-        for provider_data in result.get("providers", []):
-            score = ProviderScore(
-                provider=provider_data["provider"],
-                document_name=document_name,
-                completeness=float(provider_data["completeness"]),
-                accuracy=float(provider_data["accuracy"]),
-                hallucinations=float(provider_data["hallucinations"]),
-                citation_quality=float(provider_data["citation_quality"]),
-                overall_quality=float(provider_data["overall_quality"]),
-                reasoning=provider_data["reasoning"],
-                event_count=len(provider_outputs.get(provider_data["provider"], []))
-            )
-            provider_scores.append(score)
-
-        # Calculate cost
-        cost = getattr(self, '_last_cost', 0.0)
-
-        # Create judge result
-        judge_result = JudgeResult(
-            judge_name="claude-opus-4-1",
-            model=self.model,
-            document_name=document_name,
-            provider_scores=provider_scores,
-            winner=result.get("winner", "unknown"),
-            timestamp=datetime.now().isoformat(),
-            cost=cost,
-            thinking_tokens=thinking_tokens
-        )
-
-        logger.info(f"Claude Opus Judge winner for {document_name}: {judge_result.winner}")
-        logger.info(f"Claude thinking tokens: {thinking_tokens}, cost: ${cost:.4f}")
-
-        return judge_result
-
     def _call_api(self, prompt: str) -> str:
         """
         Make API call to Claude Opus with extended thinking.
@@ -134,7 +82,7 @@ class ClaudeOpusJudge(BaseJudge):
             # Add JSON output instruction to system prompt
             system_prompt = """You are an expert legal document analyst. You evaluate legal event extraction quality objectively.
 
-You must return your evaluation in valid JSON format only. No other text before or after the JSON.
+You must record your evaluation by calling the record_scores tool.
 
 Think deeply about your evaluation using the extended thinking budget provided."""
 
@@ -151,6 +99,9 @@ Think deeply about your evaluation using the extended thinking budget provided."
                 },
                 temperature=self.temperature,
                 system=system_prompt,
+                tools=[_SCORES_TOOL],
+                # Extended thinking only allows tool_choice "auto" (forcing a tool is rejected)
+                tool_choice={"type": "auto"},
                 messages=[
                     {
                         "role": "user",
@@ -163,9 +114,12 @@ Think deeply about your evaluation using the extended thinking budget provided."
             # Thinking appears as separate block with type="thinking"
             text_content = ""
             thinking_content = ""
+            tool_input = None
 
             for block in response.content:
-                if block.type == "text":
+                if block.type == "tool_use" and block.name == _SCORES_TOOL["name"]:
+                    tool_input = block.input
+                elif block.type == "text":
                     text_content += block.text
                 elif block.type == "thinking":
                     thinking_content = block.thinking
@@ -183,16 +137,31 @@ Think deeply about your evaluation using the extended thinking budget provided."
             # Thinking tokens are included in output tokens
             self._last_thinking_tokens = len(thinking_content.split()) * 1.3 if thinking_content else 0
 
-            logger.debug(f"Claude Opus API usage: {input_tokens} input, {output_tokens} output tokens")
-            logger.debug(f"Claude Opus thinking: {len(thinking_content)} chars")
-            logger.debug(f"Claude Opus API cost: ${self._last_cost:.4f}")
+            logger.debug("Claude Opus API usage: %d input, %d output tokens", input_tokens, output_tokens)
+            logger.debug("Claude Opus thinking: %d chars", len(thinking_content))
+            logger.debug("Claude Opus API cost: $%.4f", self._last_cost)
 
-            return text_content
+            # Only the schema-validated tool input is accepted. Extended thinking forces
+            # tool_choice "auto", so a missing tool call is retried rather than parsing free text.
+            if tool_input is None:
+                raise MissingScoresToolCall(
+                    f"Claude Opus answered without the {_SCORES_TOOL['name']} tool "
+                    f"({len(text_content)} chars of text)"
+                )
+            return json.dumps(tool_input)
 
         except Exception as e:
             logger.error(f"Claude Opus API call failed: {e}")
             raise
 
+    def _is_retryable(self, exc: Exception) -> bool:
+        """Retry rate limits, timeouts/connection errors, 5xx (incl. 529 overloaded) responses, and missing tool calls"""
+        import anthropic
+
+        if isinstance(exc, (MissingScoresToolCall, anthropic.RateLimitError, anthropic.APIConnectionError)):
+            return True
+        return isinstance(exc, anthropic.APIStatusError) and exc.status_code >= 500
+
     def is_available(self) -> bool:
         """Check if Claude Opus judge is properly configured"""
         return bool(self.api_key) and hasattr(self, 'client')
@@ -6,16 +6,26 @@ Uses Google's Gemini 2.5 Pro model with automatic thinking capabilities
 for deep reasoning about legal event extraction quality.
 """
 
-import json
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import Any, Optional
 
-from .base_judge import BaseJudge, JudgeResult, ProviderScore
+from .base_judge import BaseJudge, _SCORES_SCHEMA
 
 logger = logging.getLogger(__name__)
 
 
+def _strip_additional_properties(schema: Any) -> Any:
+    """Gemini's response_schema (OpenAPI subset) rejects additionalProperties"""
+    if isinstance(schema, dict):
+        return {k: _strip_additional_properties(v) for k, v in schema.items() if k != "additionalProperties"}
+    if isinstance(schema, list):
+        return [_strip_additional_properties(v) for v in schema]
+    return schema
+
+
+_GEMINI_SCORES_SCHEMA = _strip_additional_properties(_SCORES_SCHEMA)
+
+
 class GeminiProJudge(BaseJudge):
     """
     Gemini 2.5 Pro judge with built-in thinking capabilities.
@@ -24,11 +34,14 @@ class GeminiProJudge(BaseJudge):
     Uses JSON response format for structured output.
     """
 
+    judge_name = "gemini-2.5-pro"
+
     def __init__(
         self,
         api_key: str,
         model: str = "gemini-2.5-pro",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize Gemini Pro judge
@@ -37,8 +50,9 @@ class GeminiProJudge(BaseJudge):
             api_key: Google AI API key (GEMINI_API_KEY)
             model: Model name (default: "gemini-2.5-pro")
             temperature: Temperature (0.0 for consistency)
+            cache_dir: Optional verdict cache directory (see BaseJudge)
         """
-        super().__init__(api_key=api_key, model=model, temperature=temperature)
+        super().__init__(api_key=api_key, model=model, temperature=temperature, cache_dir=cache_dir)
 
         # Lazy import Google Generative AI
         try:
@@ -52,69 +66,6 @@ class GeminiProJudge(BaseJudge):
 
         logger.info(f"Gemini Pro Judge initialized with model: {model}")
 
-    def judge_providers(
-        self,
-        document_name: str,
-        provider_outputs: Dict[str, List[Dict[str, Any]]]
-    ) -> JudgeResult:
-        """
-        Evaluate all provider outputs using Gemini Pro with automatic thinking.
-
-        Args:
-            document_name: Name of the document being evaluated
-            provider_outputs: Dict mapping provider names to list of events
-
-        Returns:
-            JudgeResult with Gemini's scores and reasoning
-        """
-        logger.info(f"Gemini Pro Judge evaluating document: {document_name}")
-        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
-
-        # Build standardized prompt
-        prompt = self._build_judge_prompt(document_name, provider_outputs)
-
-        # Call Gemini API
-        response_text = self._call_api(prompt)
-
-        # Parse response
-        result = json.loads(response_text)
-
-        # Build ProviderScore objects
-        provider_scores = []
-        for provider_data in result.get("providers", []):
-            score = ProviderScore(
-                provider=provider_data["provider"],
-                document_name=document_name,
-                completeness=float(provider_data["completeness"]),
-                accuracy=float(provider_data["accuracy"]),
-                hallucinations=float(provider_data["hallucinations"]),
-                citation_quality=float(provider_data["citation_quality"]),
-                overall_quality=float(provider_data["overall_quality"]),
-                reasoning=provider_data["reasoning"],
-                event_count=len(provider_outputs.get(provider_data["provider"], []))
-            )
-            provider_scores.append(score)
-
-        # Calculate cost
-        cost = getattr(self, '_last_cost', 0.0)
-
-        # Create judge result
-        judge_result = JudgeResult(
-            judge_name="gemini-2.5-pro",
-            model=self.model,
-            document_name=document_name,
-            provider_scores=provider_scores,
-            winner=result.get("winner", "unknown"),
-            timestamp=datetime.now().isoformat(),
-            cost=cost,
-            thinking_tokens=0  # Gemini doesn't expose thinking tokens separately
-        )
-
-        logger.info(f"Gemini Pro Judge winner for {document_name}: {judge_result.winner}")
-        logger.info(f"Gemini cost: ${cost:.4f}")
-
-        return judge_result
-
     def _call_api(self, prompt: str) -> str:
         """
         Make API call to Gemini 2.5 Pro with automatic thinking.
@@ -129,7 +80,8 @@ class GeminiProJudge(BaseJudge):
             # Configure generation parameters for JSON output
             generation_config = {
                 "temperature": self.temperature,
-                "response_mime_type": "application/json"
+                "response_mime_type": "application/json",
+                "response_schema": _GEMINI_SCORES_SCHEMA
             }
 
             # Generate content
@@ -151,13 +103,13 @@ class GeminiProJudge(BaseJudge):
                 output_cost = (output_tokens / 1_000_000) * 5.00
                 self._last_cost = input_cost + output_cost
 
-                logger.debug(f"Gemini API usage: {input_tokens} input, {output_tokens} output tokens")
-                logger.debug(f"Gemini API cost: ${self._last_cost:.4f}")
+                logger.debug("Gemini API usage: %d input, %d output tokens", input_tokens, output_tokens)
+                logger.debug("Gemini API cost: $%.4f", self._last_cost)
             else:
                 # Fallback - estimate based on response length
                 estimated_tokens = len(prompt.split()) + len(response_text.split())
                 self._last_cost = (estimated_tokens / 1_000_000) * 2.0
-                logger.debug(f"Gemini API cost (estimated): ${self._last_cost:.4f}")
+                logger.debug("Gemini API cost (estimated): $%.4f", self._last_cost)
 
             return response_text
 
@@ -165,6 +117,20 @@ class GeminiProJudge(BaseJudge):
             logger.error(f"Gemini API call failed: {e}")
             raise
 
+    def _is_retryable(self, exc: Exception) -> bool:
+        """Retry quota exhaustion, unavailability, timeouts, and internal errors"""
+        try:
+            from google.api_core import exceptions as gexc
+        except ImportError:
+            return False
+
+        return isinstance(exc, (
+            gexc.ResourceExhausted,
+            gexc.ServiceUnavailable,
+            gexc.DeadlineExceeded,
+            gexc.InternalServerError
+        ))
+
     def is_available(self) -> bool:
         """Check if Gemini Pro judge is properly configured"""
         return bool(self.api_key) and hasattr(self, 'model_obj')
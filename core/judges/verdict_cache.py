@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Disk Cache for Judge Verdicts
+
+Judge calls are expensive (thinking budgets, premium models), and eval sweeps
+frequently re-score identical provider outputs. Verdicts are stored as JSON
+files named by the SHA-256 of their inputs so reruns become disk reads.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class VerdictCache:
+    """
+    File-per-entry JSON cache keyed by a SHA-256 content hash.
+
+    Cache failures (missing directory, corrupt entries, permission errors)
+    are logged and treated as misses - caching must never break judging.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize verdict cache
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"💾 Judge verdict cache enabled at {self.cache_dir}")
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a stable content hash from JSON-serializable parts
+
+        Args:
+            *parts: Values identifying the request (document, outputs, model, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        """Shard entries by key prefix to keep directories small"""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Load a cached value
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached value, or None on miss/corruption
+        """
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable judge cache entry {path.name}: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value atomically (write to temp file, then rename)
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable value
+        """
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write judge cache entry {path.name}: {e}")
@@ -4,8 +4,12 @@ Handles API key loading, shared prompts, and extraction calls
 """
 
 import os
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import random
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 
 try:
     import langextract as lx
@@ -13,11 +17,17 @@ try:
 except ImportError:
     LANGEXTRACT_AVAILABLE = False
 
+from .config import env_int
 from .constants import REQUIRED_ENV_VARS, DEFAULT_MODEL, LEGAL_EVENTS_PROMPT
 from .examples import get_legal_events_examples
+from .rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Error text fragments that mark a LangExtract/Gemini failure as transient
+_TRANSIENT_ERROR_MARKERS = ("429", "quota", "rate limit", "resource exhausted",
+                            "resource_exhausted", "503", "unavailable")
+
 
 class LangExtractClient:
     """
@@ -25,6 +35,10 @@ class LangExtractClient:
     Manages API keys, shared examples, and extraction calls
     """
 
+    # Few-shot examples are immutable, so one copy is shared by every client in the process
+    _examples_cache: Optional[List[Any]] = None
+    _examples_lock = threading.Lock()
+
     def __init__(self):
         self.available = LANGEXTRACT_AVAILABLE
         self.api_key = None
@@ -52,24 +66,34 @@ class LangExtractClient:
 
     def _create_shared_examples(self) -> List[lx.data.ExampleData]:
         """
-        Load shared example data from external module
+        Load shared example data from external module (built once per process)
 
         Returns:
             List of LangExtract examples or empty list on failure
         """
-        try:
-            examples = get_legal_events_examples()
+        cls = type(self)
+        if cls._examples_cache is not None:
+            return cls._examples_cache
 
-            if not examples:
-                logger.error("❌ No examples loaded from external module")
-                return []
+        with cls._examples_lock:
+            if cls._examples_cache is not None:
+                return cls._examples_cache
 
-            logger.info(f"✅ Loaded {len(examples)} examples from external module")
-            return examples
+            try:
+                examples = get_legal_events_examples()
 
-        except Exception as e:
-            logger.error(f"❌ Failed to load examples from external module: {e}")
-            return []
+                if not examples:
+                    logger.error("❌ No examples loaded from external module")
+                    return []
+
+                logger.info(f"✅ Loaded {len(examples)} examples from external module")
+                # Only successful loads are cached so a transient failure can be retried
+                cls._examples_cache = examples
+                return examples
+
+            except Exception as e:
+                logger.error(f"❌ Failed to load examples from external module: {e}")
+                return []
 
     def extract_with_prompt(self,
                            text: str,
@@ -91,6 +115,7 @@ class LangExtractClient:
             return None
 
         try:
+            # Reuse the process-wide example list unless the caller overrides it
             examples = custom_examples if custom_examples else self.shared_examples
 
             logger.info(f"🔍 Starting LangExtract call: {prompt_description}")
@@ -98,7 +123,7 @@ class LangExtractClient:
             logger.info(f"🎯 Examples: {len(examples)}")
 
             # Execute the real LangExtract API call
-            response = lx.extract(
+            response = self._extract_with_retry(
                 text_or_documents=text,
                 prompt_description=prompt_description,
                 examples=examples,
@@ -117,6 +142,40 @@ class LangExtractClient:
             logger.error(f"❌ LangExtract API call failed: {e}")
             return None
 
+    def _extract_with_retry(self, max_retries: int = 3, initial_delay: float = 1.0, **extract_kwargs) -> Any:
+        """
+        Call lx.extract, retrying rate-limit/unavailable errors with jittered exponential backoff
+
+        Args:
+            max_retries: Maximum number of retry attempts
+            initial_delay: Base delay in seconds before the first retry
+            **extract_kwargs: Arguments forwarded to lx.extract
+
+        Returns:
+            LangExtract response
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any non-transient error
+        """
+        delay = initial_delay
+
+        for attempt in range(max_retries + 1):
+            try:
+                return lx.extract(**extract_kwargs)
+            except Exception as e:
+                error_msg = str(e).lower()
+                if attempt >= max_retries or not any(m in error_msg for m in _TRANSIENT_ERROR_MARKERS):
+                    raise
+
+                # Full jitter so concurrent documents don't retry in lockstep
+                sleep_for = random.uniform(0, delay)
+                logger.warning(
+                    f"⚠️ LangExtract rate limited (attempt {attempt + 1}/{max_retries + 1}), "
+                    f"retrying in {sleep_for:.1f}s..."
+                )
+                time.sleep(sleep_for)
+                delay *= 2
+
     def is_available(self) -> bool:
         """Check if LangExtract is properly configured"""
         return self.available and bool(self.api_key)
@@ -156,45 +215,52 @@ class LangExtractClient:
         try:
             extractions = []
             dropped_count = 0
-
-            if hasattr(response, 'extractions'):
-                for extraction in response.extractions:
-                    # Get attributes and ensure document_reference is set to our filename
-                    attributes = getattr(extraction, 'attributes', {}).copy()
-                    attributes['document_reference'] = document_name
-
-                    # Capture character offsets if available (for GPT-5 integration and precise source attribution)
-                    char_interval = getattr(extraction, 'char_interval', None)
-                    start_char = getattr(extraction, 'start_char', None)
-                    end_char = getattr(extraction, 'end_char', None)
-
-                    if char_interval and hasattr(char_interval, 'start_pos') and hasattr(char_interval, 'end_pos'):
-                        attributes['char_start'] = char_interval.start_pos
-                        attributes['char_end'] = char_interval.end_pos
-                        logger.debug(f"📍 Captured char_interval: {char_interval.start_pos}-{char_interval.end_pos}")
-                    elif start_char is not None and end_char is not None:
+            no_offsets_count = 0
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # Bind getattr locally - this loop runs once per extracted event
+            _getattr = getattr
+            for extraction in _getattr(response, 'extractions', None) or ():
+                attributes = _getattr(extraction, 'attributes', None) or {}
+
+                # Filter out extractions with empty or whitespace-only event_particulars
+                if not (attributes.get('event_particulars') or '').strip():
+                    dropped_count += 1
+                    logger.warning("⚠️ Dropped extraction with empty event_particulars from %s", document_name)
+                    continue
+
+                # Ensure document_reference is set to our filename (copy, never mutate the response)
+                attributes = {**attributes, 'document_reference': document_name}
+
+                # Capture character offsets if available (for GPT-5 integration and precise source attribution)
+                char_interval = _getattr(extraction, 'char_interval', None)
+                if char_interval and hasattr(char_interval, 'start_pos') and hasattr(char_interval, 'end_pos'):
+                    attributes['char_start'] = char_interval.start_pos
+                    attributes['char_end'] = char_interval.end_pos
+                    if debug_enabled:
+                        logger.debug("📍 Captured char_interval: %s-%s", char_interval.start_pos, char_interval.end_pos)
+                else:
+                    start_char = _getattr(extraction, 'start_char', None)
+                    end_char = _getattr(extraction, 'end_char', None)
+                    if start_char is not None and end_char is not None:
                         attributes['char_start'] = start_char
                         attributes['char_end'] = end_char
-                        logger.debug(f"📍 Captured start/end chars: {start_char}-{end_char}")
+                        if debug_enabled:
+                            logger.debug("📍 Captured start/end chars: %s-%s", start_char, end_char)
                     else:
-                        logger.debug(f"📍 No character offsets available for extraction")
-
-                    # Filter out extractions with empty or whitespace-only event_particulars
-                    event_particulars = attributes.get('event_particulars', '').strip()
-                    if not event_particulars:
-                        dropped_count += 1
-                        logger.warning(f"⚠️ Dropped extraction with empty event_particulars from {document_name}")
-                        continue
-
-                    extractions.append({
-                        "extraction_text": getattr(extraction, 'extraction_text', ''),
-                        "extraction_class": getattr(extraction, 'extraction_class', ''),
-                        "attributes": attributes,
-                        "document_reference": document_name
-                    })
+                        no_offsets_count += 1
+
+                extractions.append({
+                    "extraction_text": _getattr(extraction, 'extraction_text', ''),
+                    "extraction_class": _getattr(extraction, 'extraction_class', ''),
+                    "attributes": attributes,
+                    "document_reference": document_name
+                })
 
             if dropped_count > 0:
-                logger.info(f"📋 Filtered out {dropped_count} empty extractions from {document_name}")
+                logger.info("📋 Filtered out %d empty extractions from %s", dropped_count, document_name)
+            if no_offsets_count > 0:
+                logger.debug("📍 No character offsets available for %d extractions from %s", no_offsets_count, document_name)
 
             return {
                 "success": True,
@@ -210,6 +276,76 @@ class LangExtractClient:
                 "extractions": []
             }
 
+    async def extract_legal_events_async(self, text: str, document_name: str) -> Dict[str, Any]:
+        """
+        Async wrapper around extract_legal_events
+
+        LangExtract has no async entrypoint, so the blocking call runs in a worker thread.
+
+        Args:
+            text: Document text
+            document_name: Source document filename
+
+        Returns:
+            Standardized result dictionary
+        """
+        return await asyncio.to_thread(self.extract_legal_events, text, document_name)
+
+    async def extract_many(
+        self,
+        documents: List[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract legal events from many documents concurrently
+
+        Concurrency is bounded by a semaphore and, optionally, paced to the
+        Gemini RPM quota. A failure in one document never cancels the others.
+
+        Args:
+            documents: List of (text, document_name) pairs
+            max_concurrency: Concurrent extractions (default: LANGEXTRACT_CONCURRENCY env var or 8)
+            requests_per_minute: Request pacing (default: LANGEXTRACT_RPM env var; 0 disables pacing)
+
+        Returns:
+            Standardized result dictionaries, in the same order as `documents`
+        """
+        if max_concurrency is None:
+            max_concurrency = env_int("LANGEXTRACT_CONCURRENCY", 8)
+        if requests_per_minute is None:
+            requests_per_minute = env_int("LANGEXTRACT_RPM", 0)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        limiter = AsyncRateLimiter(requests_per_minute) if requests_per_minute > 0 else None
+
+        async def _extract_one(text: str, document_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                return await self.extract_legal_events_async(text, document_name)
+
+        logger.info(f"🚀 Extracting {len(documents)} documents (concurrency={max_concurrency}, rpm={requests_per_minute or 'unlimited'})")
+
+        results = await asyncio.gather(
+            *(_extract_one(text, name) for text, name in documents),
+            return_exceptions=True
+        )
+
+        normalized = []
+        for (_, name), result in zip(documents, results):
+            if isinstance(result, BaseException):
+                logger.error(f"❌ LangExtract extraction failed for {name}: {result}")
+                normalized.append({
+                    "success": False,
+                    "error": str(result),
+                    "extractions": []
+                })
+            else:
+                normalized.append(result)
+
+        return normalized
+
     def extract_dates(self, text: str) -> Dict[str, Any]:
         """
         Extract dates using standardized prompt
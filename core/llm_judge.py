@@ -14,16 +14,168 @@ No ground truth needed - compares provider outputs directly.
 
 import os
 import json
+import time
+import random
+import asyncio
+import re
 import logging
-from typing import List, Dict, Any
-from dataclasses import dataclass, asdict
-
-from openai import OpenAI
+from collections import defaultdict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
+from dataclasses import dataclass, fields
+
+import httpx
+import numpy as np
+import openai
+from openai import OpenAI, AsyncOpenAI
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+from .rate_limiter import AsyncRateLimiter
+from .judges.verdict_cache import VerdictCache
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by every request of one client; the transport retries
+# failed connection attempts only (HTTP-level retries stay in the judge loops).
+# Limits go on the transport: a client ignores limits= when given a transport.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_HTTP_TRANSPORT_RETRIES = 3
+
+# Numeric ProviderScore criteria, in aggregation column order
+_SCORE_FIELDS = ("completeness", "accuracy", "hallucinations", "citation_quality", "overall_quality")
+
+# Static judging rubric, sent as the system message. Keeping it byte-identical and
+# first in every request lets the API reuse it as a cached prompt prefix.
+_STATIC_RUBRIC = """You are an expert legal document analyst evaluating the quality of automated legal event extraction systems. You will compare the outputs of multiple AI providers that extracted legal events from the same document. The user message names the document and lists each provider's output.
+
+**Your Task**: Score each provider on 5 criteria (0-10 scale) and identify the best provider.
+
+**Scoring Criteria** (calibrated for legal professional needs):
+
+1. **Completeness** (0-10): Did the provider capture all meaningful legal events?
+   - 10 = All events captured, no important events missed
+   - 5 = About half the events captured
+   - 0 = Very few or no events captured
+   - NOTE: High completeness with missing citations should NOT score 10 overall
+
+2. **Accuracy** (0-10): Are the dates, parties, facts, and details correct?
+   - 10 = All facts accurate, no errors
+   - 5 = Some errors but mostly correct
+   - 0 = Many errors or completely wrong
+
+3. **Hallucinations** (0-10): Are there invented facts NOT in the source?
+   - 10 = No hallucinations, all facts from source
+   - 5 = Minor invented details
+   - 0 = Many fabricated facts
+
+4. **Citation Quality** (0-10): Are legal citations accurate and properly formatted?
+   - 10 = All citations accurate and well-formatted
+   - 5 = Some citation errors or missing citations
+   - 0 = No citations or completely wrong citations
+   - **CRITICAL FOR LEGAL WORK**: Missing citations is a fatal flaw (max 5/10 overall)
+
+5. **Overall Quality** (0-10): Overall usability for legal professionals
+   - 10 = Production-ready, no corrections needed (requires proper citations)
+   - 5 = Usable with moderate corrections
+   - 0 = Not usable, requires complete rewrite
+   - **Consider**: Legal professionals need QUALITY over QUANTITY
+   - **Prefer**: 1 well-cited event over 5 events without citations
+   - **Fatal flaws**: Missing citations, hallucinations, poor accuracy
+
+**Provider Outputs** (in the user message):
+Each provider's events are a compact JSON array: d = date, e = event particulars (truncated to a fixed length), c = citation. An empty array means no events were extracted. A header such as "(showing 20 of 57 events)" means only a representative sample (the first events plus the most detailed of the rest) is shown; the provider extracted the full total.
+
+**Output Format**: Return ONLY valid JSON with this exact structure:
+
+{
+  "providers": [
+    {
+      "provider": "provider_name",
+      "completeness": 8.5,
+      "accuracy": 9.0,
+      "hallucinations": 10.0,
+      "citation_quality": 7.5,
+      "overall_quality": 8.5,
+      "reasoning": "Brief explanation of scores (2-3 sentences)"
+    }
+  ],
+  "winner": "provider_name"
+}
+
+**Important Judging Guidelines**:
+- Score ALL providers objectively
+- Use decimal scores (e.g., 8.5) for precision
+- Winner = highest overall_quality score
+- **Citation quality is CRITICAL**: Providers with missing/poor citations cannot score >7/10 overall
+- **Quality over quantity**: 1 well-cited event beats 5 events without citations
+- **Legal professional context**: Prioritize usability for lawyers (citations, accuracy, no hallucinations)
+- Reasoning should explain key strengths/weaknesses (2-3 sentences)
+- Return ONLY the JSON, no other text
+"""
+
+# Document-specific part of the judge prompt (user message); provider blocks follow it
+_JUDGE_DOCUMENT_HEADER = """**Document**: {document_name}
+
+**Provider Outputs**:
+"""
+
+# Response, checkpoint and batch-output parsing (orjson.JSONDecodeError subclasses ValueError)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Event particulars shown to the judge: a token budget when tiktoken is
+# available, otherwise a character cut of roughly the same size
+_PARTICULARS_MAX_TOKENS = 60
+_PARTICULARS_MAX_CHARS = 200
+
+# Compact JSON encoder for provider event lists, built once: json.dumps with
+# non-default options constructs a fresh JSONEncoder on every call
+_encode_compact = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Incremental re-judging: only providers whose output changed are re-scored
+_DELTA_SYSTEM_MESSAGE = (
+    "You are an expert legal document analyst re-scoring legal event extraction outputs "
+    "that changed since a previous evaluation of the same document. Apply the same five "
+    "criteria on a 0-10 scale: completeness, accuracy, hallucinations (10 = none), "
+    "citation_quality and overall_quality. Missing or poor citations cap overall_quality at 7. "
+    "Scores from the previous evaluation are final for unchanged providers. "
+    "Return results in JSON format."
+)
+
+_DELTA_FOOTER = """
+**Output Format**: Return ONLY valid JSON with this exact structure, listing ONLY the re-scored providers:
+
+{
+  "providers": [
+    {
+      "provider": "provider_name",
+      "completeness": 8.5,
+      "accuracy": 9.0,
+      "hallucinations": 10.0,
+      "citation_quality": 7.5,
+      "overall_quality": 8.5,
+      "reasoning": "Brief explanation of scores (2-3 sentences)"
+    }
+  ],
+  "winner": "provider_name"
+}
+
+Winner = highest overall_quality across ALL providers, using the previous scores for unchanged providers.
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class ProviderScore:
     """Scores for a single provider on one document"""
     provider: str
@@ -37,7 +189,7 @@ class ProviderScore:
     event_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class JudgeComparison:
     """Comparison of all providers for one document"""
     document_name: str
@@ -46,6 +198,93 @@ class JudgeComparison:
     timestamp: str
 
 
+# Field names for flat dict conversion (dataclasses.asdict deep-copies every value)
+_PROVIDER_SCORE_FIELDS = tuple(f.name for f in fields(ProviderScore))
+
+
+def _score_to_dict(score: ProviderScore) -> Dict[str, Any]:
+    """Shallow dict of a ProviderScore (all fields are scalars)"""
+    return {name: getattr(score, name) for name in _PROVIDER_SCORE_FIELDS}
+
+
+def _comparison_to_dict(comparison: JudgeComparison) -> Dict[str, Any]:
+    """Dict form of a JudgeComparison, as written to checkpoints"""
+    return {
+        "document_name": comparison.document_name,
+        "provider_scores": [_score_to_dict(score) for score in comparison.provider_scores],
+        "winner": comparison.winner,
+        "timestamp": comparison.timestamp
+    }
+
+
+class _ProviderStreamParser:
+    """
+    Incremental parser for the "providers" array of a streamed judge response
+
+    Each provider object is decoded with JSONDecoder.raw_decode as soon as its
+    closing brace arrives. Output that cannot match the judge schema raises
+    ValueError early so the caller can abort the stream.
+    """
+
+    _ARRAY_START = re.compile(r'"providers"\s*:\s*\[')
+    _REQUIRED_KEYS = ("provider", *_SCORE_FIELDS, "reasoning")
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos: Optional[int] = None  # Next unparsed index inside the array
+        self._done = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Add streamed text and return provider objects completed by it
+
+        Raises:
+            ValueError: If the response is clearly not the judge JSON schema
+        """
+        self.buffer += text
+        completed = []
+
+        if self._pos is None:
+            head = self.buffer.lstrip()
+            if head and head[0] != "{":
+                raise ValueError(f"Judge response is not a JSON object: {head[:40]!r}")
+            match = self._ARRAY_START.search(self.buffer)
+            if match is None:
+                return completed
+            self._pos = match.end()
+
+        buffer = self.buffer
+        while not self._done:
+            # Skip separators between array items
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            self._pos = pos
+            if pos >= len(buffer):
+                break
+
+            if buffer[pos] == "]":
+                self._done = True
+                break
+            if buffer[pos] != "{":
+                raise ValueError(f"Unexpected item in providers array: {buffer[pos:pos + 40]!r}")
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Object not complete yet
+
+            missing = [key for key in self._REQUIRED_KEYS if key not in item]
+            if missing:
+                raise ValueError(f"Provider entry missing {missing}")
+
+            completed.append(item)
+            self._pos = end
+
+        return completed
+
+
 class LLMJudge:
     """
     LLM-as-judge evaluator for legal event extraction quality
@@ -58,7 +297,17 @@ class LLMJudge:
         self,
         api_key: str | None = None,
         model: str = "gpt-4o-mini",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        max_concurrency: int = 10,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+        max_retries: int = 4,
+        cache_dir: Optional[str] = None,
+        cache_overwrite: bool = False,
+        incremental: bool = False,
+        delta_min_overlap: float = 0.8,
+        max_events_per_provider: Optional[int] = 20,
+        per_provider: bool = False
     ):
         """
         Initialize LLM judge
@@ -67,6 +316,20 @@ class LLMJudge:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: Model to use for judging (gpt-4o-mini recommended)
             temperature: Temperature for generation (0.0 for consistency)
+            max_concurrency: Maximum documents judged concurrently
+            max_requests_per_minute: Async request pacing (None = unthrottled)
+            max_tokens_per_minute: Async token pacing, counted with tiktoken when installed, else estimated from prompt size (None = unthrottled)
+            max_retries: Retries for rate-limit, timeout, connection and 5xx errors
+            cache_dir: Directory for cached judge responses (defaults to JUDGE_CACHE_DIR env var,
+                caching disabled when neither is set)
+            cache_overwrite: Ignore existing cache entries and re-judge (fresh results are still stored)
+            incremental: Re-score only changed providers when a document is judged again
+                by this instance (see _plan_delta)
+            delta_min_overlap: Minimum share of unchanged providers for an incremental re-judge
+            max_events_per_provider: Cap on events shown to the judge per provider, picked by
+                _select_representative (None or 0 = show all)
+            per_provider: Async judging scores each provider in its own concurrent call
+                and picks the winner locally (shorter outputs, more requests)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -74,17 +337,107 @@ class LLMJudge:
 
         self.model = model
         self.temperature = temperature
-        self.client = OpenAI(api_key=self.api_key)
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_retries = max_retries
+        self.max_events_per_provider = max_events_per_provider
+        self.per_provider = per_provider
+        self._encoding = self._load_encoding(model)
+        self._system_token_counts: Dict[str, int] = {}
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=httpx.Client(
+                timeout=_HTTP_TIMEOUT,
+                transport=httpx.HTTPTransport(limits=_HTTP_LIMITS, retries=_HTTP_TRANSPORT_RETRIES)
+            )
+        )
+        # Default async client for standalone ajudge_providers/astream calls;
+        # ajudge_multiple_documents opens its own per run (see _new_async_client)
+        self.aclient = self._new_async_client()
+
+        cache_dir = cache_dir or os.getenv("JUDGE_CACHE_DIR")
+        self.cache = VerdictCache(cache_dir) if cache_dir else None
+        self.cache_overwrite = cache_overwrite
+
+        # Per-document session state for incremental judging:
+        # {document_name: {"block_hashes": {provider: hash}, "verdict": JudgeComparison}}
+        self.incremental = incremental
+        self.delta_min_overlap = delta_min_overlap
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+
+        # Throttles bind to an event loop, so they are (re)built per running loop
+        self._limiter_loop = None
+        self._request_limiter: Optional[AsyncRateLimiter] = None
+        self._token_limiter: Optional[AsyncRateLimiter] = None
 
         logger.info(f"LLM Judge initialized with model: {model}")
 
+    @staticmethod
+    def _load_encoding(model: str):
+        """Return the tiktoken encoding for model, or None to fall back to character estimates"""
+        if not TIKTOKEN_AVAILABLE:
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            # Encodings are downloaded on first use; stay usable offline
+            logger.warning(f"⚠️ tiktoken encoding unavailable ({e}) - using character estimates")
+            return None
+
+    def _truncate_particulars(self, text: str) -> str:
+        """Cut event particulars to the judge prompt budget (tokens if possible, else characters)"""
+        if self._encoding is None:
+            return text[:_PARTICULARS_MAX_CHARS]
+        tokens = self._encoding.encode(text)
+        if len(tokens) <= _PARTICULARS_MAX_TOKENS:
+            return text
+        return self._encoding.decode(tokens[:_PARTICULARS_MAX_TOKENS])
+
+    def _estimate_tokens(self, system_message: str, prompt: str) -> int:
+        """Input tokens of a judge request, for the TPM throttle"""
+        if self._encoding is None:
+            return (len(system_message) + len(prompt)) // 4
+
+        # System messages are a few fixed strings, so their counts are computed once
+        system_tokens = self._system_token_counts.get(system_message)
+        if system_tokens is None:
+            system_tokens = self._system_token_counts[system_message] = len(self._encoding.encode(system_message))
+        return system_tokens + len(self._encoding.encode(prompt))
+
+    def _new_async_client(self) -> AsyncOpenAI:
+        """Create an AsyncOpenAI client with its own httpx connection pool"""
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(
+                timeout=_HTTP_TIMEOUT,
+                transport=httpx.AsyncHTTPTransport(limits=_HTTP_LIMITS, retries=_HTTP_TRANSPORT_RETRIES)
+            )
+        )
+
+    def close(self) -> None:
+        """Close the synchronous client's connection pool"""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close both clients' connection pools"""
+        self.client.close()
+        await self.aclient.close()
+
     def _build_judge_prompt(
         self,
         document_name: str,
         provider_outputs: Dict[str, List[Dict[str, Any]]]
     ) -> str:
         """
-        Build comprehensive judge prompt comparing all provider outputs
+        Build the document-specific judge prompt (user message)
+
+        The scoring rubric is static and travels as the system message
+        (_STATIC_RUBRIC); this prompt carries only the document name and
+        the provider outputs.
 
         Args:
             document_name: Name of the document being evaluated
@@ -93,89 +446,441 @@ class LLMJudge:
         Returns:
             Formatted prompt for the judge
         """
-        prompt = f"""You are an expert legal document analyst evaluating the quality of automated legal event extraction systems. You will compare the outputs of multiple AI providers that extracted legal events from the same document.
+        format_block = self._format_provider_block
+        return _JUDGE_DOCUMENT_HEADER.format(document_name=document_name) + "".join(
+            [format_block(provider, events) for provider, events in provider_outputs.items()]
+        )
+
+    def _format_provider_block(self, provider: str, events: List[Dict[str, Any]]) -> str:
+        """Render one provider's extracted events for a judge prompt (compact JSON, short keys)"""
+        total = len(events)
+        k = self.max_events_per_provider
+        if k and total > k:
+            events = self._select_representative(events, k)
+            logger.info(f"✂️ Judge prompt shows {k} of {total} events for provider {provider}")
+            header = f"(showing {k} of {total} events)"
+        else:
+            header = f"({total} events)"
+
+        truncate = self._truncate_particulars
+        compact = _encode_compact([
+            {
+                "d": event.get("date", "N/A"),
+                "e": truncate(event.get("event_particulars") or ""),
+                "c": event.get("citation", "")
+            }
+            for event in events
+        ])
+        return f"\n**{provider.upper()}** {header}:\n{compact}\n"
 
-**Document**: {document_name}
+    @staticmethod
+    def _select_representative(events: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+        """
+        Deterministically pick k representative events from an over-long list
 
-**Your Task**: Score each provider on 5 criteria (0-10 scale) and identify the best provider.
+        Keeps the first k//2 events as extracted, then fills the rest with the
+        remaining events that carry the most citation and particulars text
+        (ties keep extraction order). The picks are returned in extraction
+        order so the judge still sees the document's chronology.
 
-**Scoring Criteria** (calibrated for legal professional needs):
+        Args:
+            events: Provider's extracted events
+            k: Number of events to keep
 
-1. **Completeness** (0-10): Did the provider capture all meaningful legal events?
-   - 10 = All events captured, no important events missed
-   - 5 = About half the events captured
-   - 0 = Very few or no events captured
-   - NOTE: High completeness with missing citations should NOT score 10 overall
+        Returns:
+            At most k events
+        """
+        head = k // 2
+        rest = sorted(
+            range(head, len(events)),
+            key=lambda i: -(len(events[i].get("citation") or "") + len(events[i].get("event_particulars") or ""))
+        )
+        picked = sorted(rest[:k - head])
+        return events[:head] + [events[i] for i in picked]
+
+    def _build_delta_prompt(
+        self,
+        document_name: str,
+        changed_outputs: Dict[str, List[Dict[str, Any]]],
+        prev_verdict: JudgeComparison
+    ) -> str:
+        """
+        Build an incremental prompt: previous verdict summary plus changed providers only
 
-2. **Accuracy** (0-10): Are the dates, parties, facts, and details correct?
-   - 10 = All facts accurate, no errors
-   - 5 = Some errors but mostly correct
-   - 0 = Many errors or completely wrong
+        Args:
+            document_name: Name of the document being evaluated
+            changed_outputs: Outputs of the providers that changed since prev_verdict
+            prev_verdict: Previous comparison for this document
 
-3. **Hallucinations** (0-10): Are there invented facts NOT in the source?
-   - 10 = No hallucinations, all facts from source
-   - 5 = Minor invented details
-   - 0 = Many fabricated facts
+        Returns:
+            Formatted delta prompt for the judge
+        """
+        parts = [
+            f"**Document**: {document_name}\n\n",
+            "**Previous verdict** (providers not listed under updated outputs are unchanged; their scores are final):\n"
+        ]
+        parts.extend(
+            f"- {score.provider}: completeness {score.completeness}, accuracy {score.accuracy}, "
+            f"hallucinations {score.hallucinations}, citation_quality {score.citation_quality}, "
+            f"overall_quality {score.overall_quality}\n"
+            for score in prev_verdict.provider_scores
+            if score.provider not in changed_outputs
+        )
+        parts.append(f"Previous winner: {prev_verdict.winner}\n\n")
+
+        parts.append(
+            f"**Updated Provider Outputs** (re-score only these {len(changed_outputs)}; "
+            "events as JSON arrays: d = date, e = event particulars, c = citation):\n"
+        )
+        parts.extend(self._format_provider_block(provider, events) for provider, events in changed_outputs.items())
+
+        parts.append(_DELTA_FOOTER)
+        return "".join(parts)
+
+    def _build_single_provider_prompt(
+        self,
+        document_name: str,
+        provider: str,
+        events: List[Dict[str, Any]],
+        all_provider_summaries: Dict[str, str]
+    ) -> str:
+        """
+        Build a prompt that scores one provider, with the others summarized for context
 
-4. **Citation Quality** (0-10): Are legal citations accurate and properly formatted?
-   - 10 = All citations accurate and well-formatted
-   - 5 = Some citation errors or missing citations
-   - 0 = No citations or completely wrong citations
-   - **CRITICAL FOR LEGAL WORK**: Missing citations is a fatal flaw (max 5/10 overall)
+        Args:
+            document_name: Name of the document being evaluated
+            provider: Provider to score
+            events: That provider's extracted events
+            all_provider_summaries: One-line summary per provider (see _summarize_providers)
 
-5. **Overall Quality** (0-10): Overall usability for legal professionals
-   - 10 = Production-ready, no corrections needed (requires proper citations)
-   - 5 = Usable with moderate corrections
-   - 0 = Not usable, requires complete rewrite
-   - **Consider**: Legal professionals need QUALITY over QUANTITY
-   - **Prefer**: 1 well-cited event over 5 events without citations
-   - **Fatal flaws**: Missing citations, hallucinations, poor accuracy
+        Returns:
+            Formatted single-provider prompt for the judge
+        """
+        parts = [f"**Document**: {document_name}\n\n"]
+
+        others = [(name, summary) for name, summary in all_provider_summaries.items() if name != provider]
+        if others:
+            parts.append("**Other providers** (context only - do not score them):\n")
+            parts.extend(f"- {name.upper()}: {summary}\n" for name, summary in others)
+            parts.append("\n")
+
+        parts.append("**Provider Outputs**:\n")
+        parts.append(self._format_provider_block(provider, events))
+        parts.append(
+            f"\nScore ONLY {provider.upper()}: return the \"providers\" array with that single entry "
+            f"and set \"winner\" to \"{provider}\".\n"
+        )
+        return "".join(parts)
+
+    @staticmethod
+    def _summarize_providers(provider_outputs: Dict[str, List[Dict[str, Any]]]) -> Dict[str, str]:
+        """One-line event and citation counts per provider"""
+        return {
+            provider: f"{len(events)} events, {sum(1 for event in events if event.get('citation'))} with citations"
+            for provider, events in provider_outputs.items()
+        }
 
-**Provider Outputs**:
+    @staticmethod
+    def _provider_block_hashes(provider_outputs: Dict[str, List[Dict[str, Any]]]) -> Dict[str, str]:
+        """Content hash of each provider's output block"""
+        return {
+            provider: VerdictCache.make_key(provider, events)
+            for provider, events in provider_outputs.items()
+        }
 
-"""
+    def _plan_delta(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ):
+        """
+        Choose how to judge a document this instance has judged before
 
-        # Add each provider's output
-        for provider, events in provider_outputs.items():
-            prompt += f"\n**{provider.upper()}** ({len(events)} events):\n"
-            if not events:
-                prompt += "  (No events extracted)\n"
-            else:
-                for i, event in enumerate(events, 1):
-                    prompt += f"  {i}. Date: {event.get('date', 'N/A')}\n"
-                    prompt += f"     Event: {event.get('event_particulars', 'N/A')[:200]}...\n"
-                    prompt += f"     Citation: {event.get('citation', 'N/A')}\n\n"
+        Strategies, in order: unchanged outputs reuse the previous verdict;
+        small changes re-score only the changed providers; anything else is
+        judged in full.
 
-        prompt += """
-**Output Format**: Return ONLY valid JSON with this exact structure:
+        Args:
+            document_name: Name of the document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
 
-{
-  "providers": [
-    {
-      "provider": "provider_name",
-      "completeness": 8.5,
-      "accuracy": 9.0,
-      "hallucinations": 10.0,
-      "citation_quality": 7.5,
-      "overall_quality": 8.5,
-      "reasoning": "Brief explanation of scores (2-3 sentences)"
-    }
-  ],
-  "winner": "provider_name"
-}
+        Returns:
+            None for a full judge, otherwise (changed_providers, previous_verdict);
+            an empty changed list means the previous verdict can be reused as-is
+        """
+        if not self.incremental:
+            return None
 
-**Important Judging Guidelines**:
-- Score ALL providers objectively
-- Use decimal scores (e.g., 8.5) for precision
-- Winner = highest overall_quality score
-- **Citation quality is CRITICAL**: Providers with missing/poor citations cannot score >7/10 overall
-- **Quality over quantity**: 1 well-cited event beats 5 events without citations
-- **Legal professional context**: Prioritize usability for lawyers (citations, accuracy, no hallucinations)
-- Reasoning should explain key strengths/weaknesses (2-3 sentences)
-- Return ONLY the JSON, no other text
-"""
+        session = self._sessions.get(document_name)
+        if session is None:
+            return None
+
+        prev_hashes = session["block_hashes"]
+        hashes = self._provider_block_hashes(provider_outputs)
+        if hashes.keys() != prev_hashes.keys():
+            return None
+
+        order = list(hashes)
+        changed = [provider for provider in order if hashes[provider] != prev_hashes[provider]]
+        if not changed:
+            return [], session["verdict"]
+
+        overlap = 1 - len(changed) / len(order)
+        if overlap < self.delta_min_overlap:
+            return None
 
-        return prompt
+        # Only a changed tail is re-scored; edits in the middle get a full re-judge
+        if order[-len(changed):] != changed:
+            return None
+
+        return changed, session["verdict"]
+
+    def _merge_delta(
+        self,
+        prev_verdict: JudgeComparison,
+        delta: JudgeComparison,
+        changed: List[str]
+    ) -> JudgeComparison:
+        """
+        Combine re-scored providers with the previous verdict's unchanged scores
+
+        Args:
+            prev_verdict: Previous comparison for the document
+            delta: Comparison parsed from the delta response
+            changed: Providers that were re-scored
+
+        Returns:
+            JudgeComparison covering every provider
+        """
+        rescored = {score.provider: score for score in delta.provider_scores}
+        missing = [provider for provider in changed if provider not in rescored]
+        if missing:
+            logger.warning(f"⚠️ Delta judge omitted {missing} for {prev_verdict.document_name} - keeping previous scores")
+
+        provider_scores = [rescored.get(score.provider, score) for score in prev_verdict.provider_scores]
+        known = {score.provider for score in provider_scores}
+        provider_scores.extend(score for provider, score in rescored.items() if provider not in known)
+
+        winner = delta.winner
+        if winner not in {score.provider for score in provider_scores} and provider_scores:
+            winner = max(provider_scores, key=lambda score: score.overall_quality).provider
+
+        return JudgeComparison(
+            document_name=prev_verdict.document_name,
+            provider_scores=provider_scores,
+            winner=winner,
+            timestamp=delta.timestamp
+        )
+
+    def _remember_session(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        comparison: JudgeComparison
+    ) -> None:
+        """Record the latest verdict and block hashes for incremental re-judging"""
+        if self.incremental:
+            self._sessions[document_name] = {
+                "block_hashes": self._provider_block_hashes(provider_outputs),
+                "verdict": comparison
+            }
+
+    def _build_messages(self, prompt: str, system_message: str = _STATIC_RUBRIC) -> List[Dict[str, str]]:
+        """Chat messages for a judge request"""
+        return [
+            {
+                "role": "system",
+                "content": system_message
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def _cache_lookup(self, prompt: str):
+        """
+        Look up a cached raw judge response for this prompt
+
+        The key covers the rubric, prompt, model and temperature so verdicts never
+        leak across judge configurations.
+
+        Args:
+            prompt: Fully built judge prompt
+
+        Returns:
+            (cache_key, cached_entry) - key is None when caching is disabled,
+            entry is None on a miss or when cache_overwrite is set
+        """
+        if self.cache is None:
+            return None, None
+
+        cache_key = VerdictCache.make_key(_STATIC_RUBRIC, prompt, self.model, self.temperature)
+        if self.cache_overwrite:
+            return cache_key, None
+
+        cached = self.cache.get(cache_key)
+        if not isinstance(cached, dict) or "content" not in cached:
+            return cache_key, None
+        return cache_key, cached
+
+    def _build_request_body(self, prompt: str, system_message: str = _STATIC_RUBRIC) -> Dict[str, Any]:
+        """Chat completion request body (shared by realtime and batch judging)"""
+        return {
+            "model": self.model,
+            "messages": self._build_messages(prompt, system_message),
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"}
+        }
+
+    @staticmethod
+    def _make_provider_score(
+        provider_data: Dict[str, Any],
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> ProviderScore:
+        """Build a ProviderScore from one entry of the judge's "providers" array"""
+        return ProviderScore(
+            provider=provider_data["provider"],
+            document_name=document_name,
+            completeness=float(provider_data["completeness"]),
+            accuracy=float(provider_data["accuracy"]),
+            hallucinations=float(provider_data["hallucinations"]),
+            citation_quality=float(provider_data["citation_quality"]),
+            overall_quality=float(provider_data["overall_quality"]),
+            reasoning=provider_data["reasoning"],
+            event_count=len(provider_outputs.get(provider_data["provider"], []))
+        )
+
+    def _parse_comparison(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        result_text: str,
+        created: Any
+    ) -> JudgeComparison:
+        """
+        Build a JudgeComparison from the judge's JSON answer
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Provider outputs that were judged (for event counts)
+            result_text: JSON content of the chat completion message
+            created: Completion creation time (unix seconds)
+
+        Returns:
+            JudgeComparison with scores for all providers
+        """
+        result = _json_loads(result_text)
+
+        logger.info(f"Judge response received: {len(result.get('providers', []))} providers scored")
+
+        # Build ProviderScore objects
+        provider_scores = [
+            self._make_provider_score(provider_data, document_name, provider_outputs)
+            for provider_data in result.get("providers", [])
+        ]
+
+        # Create comparison
+        comparison = JudgeComparison(
+            document_name=document_name,
+            provider_scores=provider_scores,
+            winner=result.get("winner", "unknown"),
+            timestamp=str(created)
+        )
+
+        logger.info(f"Winner for {document_name}: {comparison.winner}")
+
+        return comparison
+
+    def _prepare_judge_call(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ):
+        """
+        Serve a judge request from the cache or previous verdict, or plan the API call
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+
+        Returns:
+            (comparison, call) - comparison is set when no API call is needed,
+            otherwise call is (prompt, system_message, cache_key, delta)
+        """
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            logger.info(f"💾 Judge verdict for {document_name} served from cache")
+            comparison = self._parse_comparison(document_name, provider_outputs, cached["content"], cached["created"])
+            self._remember_session(document_name, provider_outputs, comparison)
+            return comparison, None
+
+        delta = self._plan_delta(document_name, provider_outputs)
+        system_message = _STATIC_RUBRIC
+        if delta is not None:
+            changed, prev_verdict = delta
+            if not changed:
+                logger.info(f"♻️ Provider outputs for {document_name} unchanged - reusing previous verdict")
+                return prev_verdict, None
+            logger.info(f"♻️ Incremental re-judge of {document_name}: {changed}")
+            prompt = self._build_delta_prompt(
+                document_name, {provider: provider_outputs[provider] for provider in changed}, prev_verdict
+            )
+            system_message = _DELTA_SYSTEM_MESSAGE
+
+        return None, (prompt, system_message, cache_key, delta)
+
+    def _finish_judge_call(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        response: Any,
+        cache_key: Optional[str],
+        delta
+    ) -> JudgeComparison:
+        """
+        Parse a judge response, merge it into the previous verdict for a delta
+        judge, then cache it and remember the session
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+            response: Chat completion returned by the judge call
+            cache_key: Verdict cache key from _prepare_judge_call (None when disabled)
+            delta: Delta plan from _prepare_judge_call (None for a full judge)
+
+        Returns:
+            JudgeComparison with scores for all providers
+        """
+        result_text = response.choices[0].message.content
+        comparison = self._parse_comparison(document_name, provider_outputs, result_text, response.created)
+
+        if delta is not None:
+            changed, prev_verdict = delta
+            comparison = self._merge_delta(prev_verdict, comparison, changed)
+        elif cache_key is not None:
+            # Store only full responses that parsed, so a bad answer is never replayed
+            self.cache.set(cache_key, {"content": result_text, "created": response.created})
+
+        self._remember_session(document_name, provider_outputs, comparison)
+        return comparison
+
+    def _create_with_retry(self, document_name: str, prompt: str, system_message: str):
+        """Chat completion call, retrying transient errors with jittered backoff"""
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.client.chat.completions.create(**self._build_request_body(prompt, system_message))
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                sleep_for = random.uniform(0, delay)
+                logger.warning(f"⚠️ Judge call for {document_name} failed ({type(e).__name__}), retrying in {sleep_for:.1f}s")
+                time.sleep(sleep_for)
+                delay = min(delay * 2, 60.0)
 
     def judge_providers(
         self,
@@ -195,72 +900,371 @@ class LLMJudge:
         logger.info(f"Judging providers for document: {document_name}")
         logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
 
-        # Build prompt
-        prompt = self._build_judge_prompt(document_name, provider_outputs)
+        comparison, call = self._prepare_judge_call(document_name, provider_outputs)
+        if comparison is not None:
+            return comparison
+        prompt, system_message, cache_key, delta = call
 
-        # Call OpenAI with JSON mode
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert legal document analyst. You evaluate legal event extraction quality objectively and return results in JSON format."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"}
-            )
+            response = self._create_with_retry(document_name, prompt, system_message)
+            return self._finish_judge_call(document_name, provider_outputs, response, cache_key, delta)
+        except Exception as e:
+            logger.error(f"Error during judging {document_name}: {e}")
+            raise
 
-            # Parse response
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
-
-            logger.info(f"Judge response received: {len(result.get('providers', []))} providers scored")
-
-            # Build ProviderScore objects
-            provider_scores = []
-            for provider_data in result.get("providers", []):
-                score = ProviderScore(
-                    provider=provider_data["provider"],
-                    document_name=document_name,
-                    completeness=float(provider_data["completeness"]),
-                    accuracy=float(provider_data["accuracy"]),
-                    hallucinations=float(provider_data["hallucinations"]),
-                    citation_quality=float(provider_data["citation_quality"]),
-                    overall_quality=float(provider_data["overall_quality"]),
-                    reasoning=provider_data["reasoning"],
-                    event_count=len(provider_outputs.get(provider_data["provider"], []))
-                )
-                provider_scores.append(score)
-
-            # Create comparison
-            comparison = JudgeComparison(
-                document_name=document_name,
-                provider_scores=provider_scores,
-                winner=result.get("winner", "unknown"),
-                timestamp=response.created.__str__()
-            )
+    async def ajudge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        client: Optional[AsyncOpenAI] = None
+    ) -> JudgeComparison:
+        """
+        Async version of judge_providers using AsyncOpenAI
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+            client: AsyncOpenAI client to call (defaults to self.aclient)
+
+        Returns:
+            JudgeComparison with scores for all providers
+        """
+        logger.info(f"Judging providers for document: {document_name}")
+        logger.info(f"Providers to compare: {list(provider_outputs.keys())}")
 
-            logger.info(f"Winner for {document_name}: {comparison.winner}")
+        client = client or self.aclient
+        if self.per_provider:
+            return await self._ajudge_per_provider(document_name, provider_outputs, client)
 
+        comparison, call = self._prepare_judge_call(document_name, provider_outputs)
+        if comparison is not None:
             return comparison
+        prompt, system_message, cache_key, delta = call
+
+        try:
+            response = await self._acreate_with_retry(document_name, prompt, system_message, client)
+            return self._finish_judge_call(document_name, provider_outputs, response, cache_key, delta)
+        except Exception as e:
+            logger.error(f"Error during judging {document_name}: {e}")
+            raise
+
+    async def _acreate_with_retry(
+        self,
+        document_name: str,
+        prompt: str,
+        system_message: str,
+        client: AsyncOpenAI
+    ):
+        """Throttled chat completion call, retrying transient errors with jittered backoff"""
+        request_limiter, token_limiter = self._get_limiters()
+
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            # Throttle every attempt, retries included, to stay inside RPM/TPM quotas
+            if request_limiter is not None:
+                await request_limiter.acquire()
+            if token_limiter is not None:
+                await token_limiter.acquire(self._estimate_tokens(system_message, prompt))
+
+            try:
+                return await client.chat.completions.create(**self._build_request_body(prompt, system_message))
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                sleep_for = random.uniform(0, delay)
+                logger.warning(f"⚠️ Judge call for {document_name} failed ({type(e).__name__}), retrying in {sleep_for:.1f}s")
+                await asyncio.sleep(sleep_for)
+                delay = min(delay * 2, 60.0)
+
+    async def _ascore_one(
+        self,
+        document_name: str,
+        provider: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        summaries: Dict[str, str],
+        client: AsyncOpenAI
+    ) -> ProviderScore:
+        """Score a single provider with its own judge call (cached like full verdicts)"""
+        prompt = self._build_single_provider_prompt(document_name, provider, provider_outputs[provider], summaries)
+
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            result_text = cached["content"]
+        else:
+            response = await self._acreate_with_retry(document_name, prompt, _STATIC_RUBRIC, client)
+            result_text = response.choices[0].message.content
+
+        entries = _json_loads(result_text).get("providers") or []
+        if not entries:
+            raise ValueError(f"Judge returned no scores for {provider} on {document_name}")
+
+        # The provider is known; don't depend on how the judge spelled its name
+        score = self._make_provider_score({**entries[0], "provider": provider}, document_name, provider_outputs)
+
+        if cached is None and cache_key is not None:
+            self.cache.set(cache_key, {"content": result_text, "created": response.created})
+        return score
+
+    async def _ajudge_per_provider(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]],
+        client: AsyncOpenAI
+    ) -> JudgeComparison:
+        """
+        Judge a document with one concurrent call per provider
+
+        Each call generates a single provider's scores, so output time stays
+        roughly constant as providers are added. The winner is the highest
+        overall_quality, picked locally. With incremental judging, only the
+        providers chosen by _plan_delta are re-scored.
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+            client: AsyncOpenAI client to call
 
+        Returns:
+            JudgeComparison with scores for all providers
+        """
+        to_score = list(provider_outputs)
+        previous: Dict[str, ProviderScore] = {}
+
+        delta = self._plan_delta(document_name, provider_outputs)
+        if delta is not None:
+            changed, prev_verdict = delta
+            if not changed:
+                logger.info(f"♻️ Provider outputs for {document_name} unchanged - reusing previous verdict")
+                return prev_verdict
+            logger.info(f"♻️ Incremental re-judge of {document_name}: {changed}")
+            previous = {score.provider: score for score in prev_verdict.provider_scores}
+            to_score = changed
+
+        summaries = self._summarize_providers(provider_outputs)
+        try:
+            scores = await asyncio.gather(
+                *(self._ascore_one(document_name, provider, provider_outputs, summaries, client) for provider in to_score)
+            )
         except Exception as e:
-            logger.error(f"Error during judging: {e}")
+            logger.error(f"Error during judging {document_name}: {e}")
             raise
 
+        rescored = dict(zip(to_score, scores))
+        provider_scores = [rescored.get(provider) or previous[provider] for provider in provider_outputs]
+        winner = max(provider_scores, key=lambda score: score.overall_quality).provider if provider_scores else "unknown"
+
+        comparison = JudgeComparison(
+            document_name=document_name,
+            provider_scores=provider_scores,
+            winner=winner,
+            timestamp=str(int(time.time()))
+        )
+        logger.info(f"Winner for {document_name}: {winner} ({len(to_score)} per-provider judge calls)")
+
+        self._remember_session(document_name, provider_outputs, comparison)
+        return comparison
+
+    def stream_judge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> Iterator[ProviderScore]:
+        """
+        Judge a document with a streamed response, yielding scores as they complete
+
+        Each ProviderScore is yielded as soon as its JSON object has arrived.
+        If the output stops matching the judge schema the stream is closed
+        early (saving output tokens) and ValueError is raised. Streaming calls
+        are not retried, cached, or judged incrementally - use judge_providers
+        for those.
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+
+        Yields:
+            ProviderScore for each provider, in response order
+        """
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+        parser = _ProviderStreamParser()
+
+        stream = self.client.chat.completions.create(**self._build_request_body(prompt), stream=True)
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                for provider_data in parser.feed(content):
+                    yield self._make_provider_score(provider_data, document_name, provider_outputs)
+        finally:
+            stream.close()
+
+    async def astream_judge_providers(
+        self,
+        document_name: str,
+        provider_outputs: Dict[str, List[Dict[str, Any]]]
+    ) -> AsyncIterator[ProviderScore]:
+        """
+        Async version of stream_judge_providers using AsyncOpenAI
+
+        Args:
+            document_name: Name of document being evaluated
+            provider_outputs: Dict mapping provider names to list of events
+
+        Yields:
+            ProviderScore for each provider, in response order
+        """
+        prompt = self._build_judge_prompt(document_name, provider_outputs)
+        parser = _ProviderStreamParser()
+
+        request_limiter, token_limiter = self._get_limiters()
+        if request_limiter is not None:
+            await request_limiter.acquire()
+        if token_limiter is not None:
+            await token_limiter.acquire(self._estimate_tokens(_STATIC_RUBRIC, prompt))
+
+        stream = await self.aclient.chat.completions.create(**self._build_request_body(prompt), stream=True)
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                for provider_data in parser.feed(content):
+                    yield self._make_provider_score(provider_data, document_name, provider_outputs)
+        finally:
+            await stream.close()
+
+    @staticmethod
+    def _is_retryable(exc: Exception) -> bool:
+        """Rate limits, timeouts/connection errors and 5xx responses are transient"""
+        if isinstance(exc, (openai.RateLimitError, openai.APIConnectionError)):
+            return True
+        return isinstance(exc, openai.APIStatusError) and exc.status_code >= 500
+
+    def _get_limiters(self):
+        """Return (request_limiter, token_limiter) for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._limiter_loop is not loop:
+            self._request_limiter = (
+                AsyncRateLimiter(self.max_requests_per_minute) if self.max_requests_per_minute else None
+            )
+            self._token_limiter = (
+                AsyncRateLimiter(self.max_tokens_per_minute) if self.max_tokens_per_minute else None
+            )
+            self._limiter_loop = loop
+        return self._request_limiter, self._token_limiter
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: Path) -> Dict[str, JudgeComparison]:
+        """Load completed comparisons from a JSONL checkpoint (one comparison per line)"""
+        completed = {}
+        if not checkpoint_path.exists():
+            return completed
+
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    data = _json_loads(line)
+                    data["provider_scores"] = [ProviderScore(**s) for s in data["provider_scores"]]
+                    comparison = JudgeComparison(**data)
+                except (ValueError, KeyError, TypeError) as e:
+                    # A partially written last line from an interrupted run
+                    logger.warning(f"⚠️ Skipping unreadable checkpoint line: {e}")
+                    continue
+                completed[comparison.document_name] = comparison
+
+        return completed
+
+    async def ajudge_multiple_documents(
+        self,
+        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        max_concurrency: Optional[int] = None,
+        checkpoint_path: Optional[str] = None
+    ) -> List[JudgeComparison]:
+        """
+        Judge provider outputs across multiple documents concurrently
+
+        Judging is network-bound, so documents are judged in parallel (bounded by
+        a semaphore and the RPM/TPM throttles) and total time tracks the slowest
+        call rather than the sum. Each run opens its own AsyncOpenAI client, bound
+        to the current event loop, and closes its connection pool when done.
+
+        Args:
+            document_results: Dict mapping document names to provider outputs
+            max_concurrency: Concurrent judge calls (defaults to the instance setting)
+            checkpoint_path: Optional JSONL file; each finished comparison is appended
+                as it completes and documents already present are skipped on re-runs
+
+        Returns:
+            List of JudgeComparison objects, in the same order as document_results
+
+        Raises:
+            The first document's exception if any document failed; the others
+            still run to completion (and are checkpointed) first
+        """
+        concurrency = max_concurrency or self.max_concurrency
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        checkpoint = Path(checkpoint_path) if checkpoint_path else None
+        completed = self._load_checkpoint(checkpoint) if checkpoint else {}
+        if completed:
+            logger.info(f"💾 Resuming from checkpoint: {len(completed)} documents already judged")
+
+        async def _judge_one(doc_name: str, provider_outputs: Dict[str, List[Dict[str, Any]]]) -> JudgeComparison:
+            async with semaphore:
+                comparison = await self.ajudge_providers(doc_name, provider_outputs, client=aclient)
+
+            if checkpoint is not None:
+                with open(checkpoint, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(_comparison_to_dict(comparison)) + "\n")
+
+            return comparison
+
+        pending = {name: outputs for name, outputs in document_results.items() if name not in completed}
+        logger.info(f"Judging {len(pending)} documents (concurrency={concurrency})")
+
+        # Let every document finish before the shared client closes, so one failure
+        # neither breaks the calls still in flight nor loses their checkpoints
+        async with self._new_async_client() as aclient:
+            results = await asyncio.gather(
+                *(_judge_one(doc_name, provider_outputs) for doc_name, provider_outputs in pending.items()),
+                return_exceptions=True
+            )
+
+        failures = {}
+        for doc_name, result in zip(pending.keys(), results):
+            if isinstance(result, BaseException):
+                failures[doc_name] = result
+            else:
+                completed[doc_name] = result
+
+        if failures:
+            logger.error(
+                f"❌ Judging failed for {len(failures)}/{len(pending)} documents: {list(failures)}"
+                + (" - finished documents are checkpointed" if checkpoint is not None else "")
+            )
+            raise next(iter(failures.values()))
+
+        return [completed[doc_name] for doc_name in document_results]
+
     def judge_multiple_documents(
         self,
-        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]]
+        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        max_concurrency: Optional[int] = None,
+        checkpoint_path: Optional[str] = None
     ) -> List[JudgeComparison]:
         """
         Judge provider outputs across multiple documents
 
+        Synchronous wrapper around ajudge_multiple_documents; call that directly
+        when already running inside an event loop.
+
         Args:
             document_results: Dict mapping document names to provider outputs
                 Format: {
@@ -270,21 +1274,130 @@ class LLMJudge:
                     },
                     "doc2.pdf": {...}
                 }
+            max_concurrency: Concurrent judge calls (defaults to the instance setting)
+            checkpoint_path: Optional JSONL checkpoint for resumable runs
 
         Returns:
             List of JudgeComparison objects, one per document
         """
-        comparisons = []
+        return asyncio.run(self.ajudge_multiple_documents(document_results, max_concurrency, checkpoint_path))
+
+    def submit_batch(
+        self,
+        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]]
+    ) -> str:
+        """
+        Submit judging for many documents as one OpenAI Batch API job
+
+        Batch jobs cost 50% of realtime pricing and use a separate rate-limit pool,
+        at the price of up to 24h completion - suited to offline evaluation runs.
 
+        Args:
+            document_results: Dict mapping document names to provider outputs
+
+        Returns:
+            Batch ID to pass to wait_for_batch()
+        """
+        lines = []
         for doc_name, provider_outputs in document_results.items():
-            logger.info(f"\n{'='*70}")
-            logger.info(f"Judging document: {doc_name}")
-            logger.info(f"{'='*70}")
+            prompt = self._build_judge_prompt(doc_name, provider_outputs)
+            lines.append(json.dumps({
+                "custom_id": doc_name,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request_body(prompt)
+            }))
+
+        batch_file = self.client.files.create(
+            file=("judge_batch.jsonl", ("\n".join(lines) + "\n").encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        logger.info(f"🚀 Submitted judge batch {batch.id} ({len(lines)} documents)")
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        poll_interval: float = 30
+    ) -> List[JudgeComparison]:
+        """
+        Poll a judge batch until it finishes and parse its results
+
+        Args:
+            batch_id: ID returned by submit_batch()
+            document_results: The provider outputs that were submitted (for event counts)
+            poll_interval: Seconds between status checks
+
+        Returns:
+            JudgeComparison objects in document_results order; documents whose
+            request failed inside the batch are logged and omitted
 
-            comparison = self.judge_providers(doc_name, provider_outputs)
-            comparisons.append(comparison)
+        Raises:
+            RuntimeError: If the batch fails, expires or is cancelled
+        """
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Judge batch {batch_id} ended with status: {batch.status}")
+
+            logger.info(f"Judge batch {batch_id} status: {batch.status} - checking again in {poll_interval}s")
+            time.sleep(poll_interval)
+
+        comparisons = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+
+                entry = _json_loads(line)
+                doc_name = entry["custom_id"]
+                response = entry.get("response") or {}
+
+                if entry.get("error") or response.get("status_code") != 200:
+                    logger.error(f"❌ Batch judging failed for {doc_name}: {entry.get('error') or response.get('body')}")
+                    continue
+
+                body = response["body"]
+                comparisons[doc_name] = self._parse_comparison(
+                    doc_name,
+                    document_results.get(doc_name, {}),
+                    body["choices"][0]["message"]["content"],
+                    body.get("created")
+                )
+
+        missing = len(document_results) - len(comparisons)
+        if missing:
+            logger.warning(f"⚠️ Judge batch {batch_id}: {missing} documents have no result")
+
+        return [comparisons[doc_name] for doc_name in document_results if doc_name in comparisons]
 
-        return comparisons
+    def judge_multiple_documents_batch(
+        self,
+        document_results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        poll_interval: float = 30
+    ) -> List[JudgeComparison]:
+        """
+        Judge many documents through the Batch API (submit, then wait)
+
+        Args:
+            document_results: Dict mapping document names to provider outputs
+            poll_interval: Seconds between status checks
+
+        Returns:
+            List of JudgeComparison objects, one per successfully judged document
+        """
+        batch_id = self.submit_batch(document_results)
+        return self.wait_for_batch(batch_id, document_results, poll_interval)
 
     def aggregate_scores(
         self,
@@ -307,44 +1420,34 @@ class LLMJudge:
                 }
             }
         """
-        provider_scores = {}
+        # One (completeness, accuracy, hallucinations, citation_quality, overall_quality) row per document
+        rows = defaultdict(list)
+        wins = defaultdict(int)
 
         for comparison in comparisons:
             for score in comparison.provider_scores:
-                if score.provider not in provider_scores:
-                    provider_scores[score.provider] = {
-                        "completeness": [],
-                        "accuracy": [],
-                        "hallucinations": [],
-                        "citation_quality": [],
-                        "overall_quality": [],
-                        "wins": 0,
-                        "total_docs": 0
-                    }
-
-                provider_scores[score.provider]["completeness"].append(score.completeness)
-                provider_scores[score.provider]["accuracy"].append(score.accuracy)
-                provider_scores[score.provider]["hallucinations"].append(score.hallucinations)
-                provider_scores[score.provider]["citation_quality"].append(score.citation_quality)
-                provider_scores[score.provider]["overall_quality"].append(score.overall_quality)
-                provider_scores[score.provider]["total_docs"] += 1
-
+                rows[score.provider].append((
+                    score.completeness,
+                    score.accuracy,
+                    score.hallucinations,
+                    score.citation_quality,
+                    score.overall_quality
+                ))
                 if score.provider == comparison.winner:
-                    provider_scores[score.provider]["wins"] += 1
+                    wins[score.provider] += 1
 
-        # Calculate averages
+        # Calculate averages (column means over the provider's documents x criteria matrix)
         aggregated = {}
-        for provider, scores in provider_scores.items():
-            aggregated[provider] = {
-                "completeness": sum(scores["completeness"]) / len(scores["completeness"]),
-                "accuracy": sum(scores["accuracy"]) / len(scores["accuracy"]),
-                "hallucinations": sum(scores["hallucinations"]) / len(scores["hallucinations"]),
-                "citation_quality": sum(scores["citation_quality"]) / len(scores["citation_quality"]),
-                "overall_quality": sum(scores["overall_quality"]) / len(scores["overall_quality"]),
-                "win_rate": scores["wins"] / scores["total_docs"],
-                "total_wins": scores["wins"],
-                "total_docs": scores["total_docs"]
-            }
+        for provider, provider_rows in rows.items():
+            means = np.asarray(provider_rows, dtype=np.float64).mean(axis=0).tolist()
+            total_docs = len(provider_rows)
+
+            aggregated[provider] = dict(zip(_SCORE_FIELDS, means))
+            aggregated[provider].update({
+                "win_rate": wins[provider] / total_docs,
+                "total_wins": wins[provider],
+                "total_docs": total_docs
+            })
 
         return aggregated
 
@@ -360,44 +1463,31 @@ class LLMJudge:
 
         Returns:
             Dict mapping categories to champion provider names
+
+        Raises:
+            ValueError: If aggregated_scores is empty
         """
-        champions = {}
-
-        # Overall quality champion
-        champions["overall_quality"] = max(
-            aggregated_scores.items(),
-            key=lambda x: x[1]["overall_quality"]
-        )[0]
-
-        # Completeness champion
-        champions["completeness"] = max(
-            aggregated_scores.items(),
-            key=lambda x: x[1]["completeness"]
-        )[0]
-
-        # Accuracy champion
-        champions["accuracy"] = max(
-            aggregated_scores.items(),
-            key=lambda x: x[1]["accuracy"]
-        )[0]
-
-        # No hallucinations champion
-        champions["no_hallucinations"] = max(
-            aggregated_scores.items(),
-            key=lambda x: x[1]["hallucinations"]
-        )[0]
-
-        # Citation quality champion
-        champions["citation_quality"] = max(
-            aggregated_scores.items(),
-            key=lambda x: x[1]["citation_quality"]
-        )[0]
-
-        # Win rate champion
-        champions["win_rate"] = max(
-            aggregated_scores.items(),
-            key=lambda x: x[1]["win_rate"]
-        )[0]
+        if not aggregated_scores:
+            raise ValueError("No aggregated scores to pick champions from")
+
+        # Champion category -> aggregated metric it is judged on
+        categories = {
+            "overall_quality": "overall_quality",
+            "completeness": "completeness",
+            "accuracy": "accuracy",
+            "no_hallucinations": "hallucinations",
+            "citation_quality": "citation_quality",
+            "win_rate": "win_rate"
+        }
+        best = {category: (None, float("-inf")) for category in categories}
+
+        # Single pass; strict ">" keeps the first provider on ties
+        for provider, scores in aggregated_scores.items():
+            for category, metric in categories.items():
+                if scores[metric] > best[category][1]:
+                    best[category] = (provider, scores[metric])
+
+        champions = {category: provider for category, (provider, _) in best.items()}
 
         return champions
 
@@ -409,7 +1499,8 @@ class LLMJudge:
         output_path: str
     ):
         """
-        Export complete evaluation results to JSON
+        Export complete evaluation results to JSON (for human inspection;
+        use export_results_parquet for downstream analysis)
 
         Args:
             comparisons: List of per-document comparisons
@@ -422,7 +1513,7 @@ class LLMJudge:
                 {
                     "document": comp.document_name,
                     "winner": comp.winner,
-                    "scores": [asdict(score) for score in comp.provider_scores]
+                    "scores": comp.provider_scores
                 }
                 for comp in comparisons
             ],
@@ -431,11 +1522,61 @@ class LLMJudge:
             "total_documents": len(comparisons)
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        # orjson serializes the ProviderScore dataclasses natively; stdlib json converts them via default
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(export_data, f, indent=2, default=_score_to_dict)
 
         logger.info(f"Results exported to {output_path}")
 
+    def export_results_parquet(
+        self,
+        comparisons: List[JudgeComparison],
+        output_path: str
+    ):
+        """
+        Export per-provider scores to a Parquet file (one row per document/provider)
+
+        Scores are stored as float32 and document, winner and provider names are
+        dictionary-encoded, so the file stays small and single columns can be read
+        (or streamed with pyarrow.dataset) without loading the whole run.
+
+        Args:
+            comparisons: List of per-document comparisons
+            output_path: Path to save Parquet file
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("pyarrow library not available - Parquet export is disabled")
+            raise
+
+        label = pa.dictionary(pa.int32(), pa.string())
+        schema = pa.schema(
+            [("document_name", label), ("winner", label), ("provider", label)]
+            + [(name, pa.float32()) for name in _SCORE_FIELDS]
+            + [("reasoning", pa.string()), ("event_count", pa.int32())]
+        )
+
+        # Every column after document_name/winner is a ProviderScore attribute
+        score_columns = schema.names[2:]
+        columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        for comp in comparisons:
+            for score in comp.provider_scores:
+                columns["document_name"].append(comp.document_name)
+                columns["winner"].append(comp.winner)
+                for name in score_columns:
+                    columns[name].append(getattr(score, name))
+
+        table = pa.Table.from_pydict(columns, schema=schema)
+        pq.write_table(table, output_path, compression="zstd", use_dictionary=True)
+
+        logger.info(f"Results exported to {output_path} ({table.num_rows} rows)")
+
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""
+Async rate limiting for concurrent provider calls
+Token bucket that paces requests (or tokens) to a per-minute budget
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiter for asyncio code
+
+    Capacity refills continuously at max_per_minute / 60 units per second.
+    Waiters are served in arrival order. Create one per event loop (e.g. per
+    asyncio.run() call) since the internal lock binds to the running loop.
+
+    Usage:
+        limiter = AsyncRateLimiter(max_per_minute=60)
+        async with limiter:
+            await call_api()
+
+        # Or consume a variable amount (e.g. estimated tokens)
+        await limiter.acquire(estimated_tokens)
+    """
+
+    def __init__(self, max_per_minute: float):
+        """
+        Args:
+            max_per_minute: Units (requests or tokens) allowed per minute
+        """
+        if max_per_minute <= 0:
+            raise ValueError("max_per_minute must be positive")
+
+        self.capacity = float(max_per_minute)
+        self.refill_per_second = self.capacity / 60.0
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        """Add capacity accrued since the last update"""
+        now = time.monotonic()
+        self._available = min(self.capacity, self._available + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until `amount` units are available and consume them
+
+        Args:
+            amount: Units to consume (clamped to capacity so oversized requests still proceed)
+        """
+        amount = min(float(amount), self.capacity)
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                await asyncio.sleep((amount - self._available) / self.refill_per_second)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
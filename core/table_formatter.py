@@ -3,14 +3,110 @@ Table Formatter - Shared formatting logic for five-column legal events table
 Ensures consistency between pipeline, UI, and downloads
 """
 
+import io
+import re
+import numpy as np
 import pandas as pd
 import logging
 from typing import List, Dict, Any, Optional
 
-from .constants import FIVE_COLUMN_HEADERS, INTERNAL_FIELDS, DEFAULT_NO_DATE
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .constants import (
+    FIVE_COLUMN_HEADERS,
+    INTERNAL_FIELDS,
+    DEFAULT_NO_CITATION,
+    DEFAULT_NO_DATE,
+    DEFAULT_NO_PARTICULARS,
+    DEFAULT_NO_REFERENCE
+)
 
 logger = logging.getLogger(__name__)
 
+# Display headers bound once: No, Date, Event Particulars, Citation, Document Reference
+_NUM_COL, _DATE_COL, _PARTICULARS_COL, _CITATION_COL, _DOC_COL = FIVE_COLUMN_HEADERS
+_HEADERS_TUPLE = tuple(FIVE_COLUMN_HEADERS)
+
+# Defaults for records missing a core field ("number" defaults to the record position)
+_FIELD_DEFAULTS = {
+    "date": DEFAULT_NO_DATE,
+    "event_particulars": DEFAULT_NO_PARTICULARS,
+    "citation": DEFAULT_NO_CITATION,
+    "document_reference": DEFAULT_NO_REFERENCE
+}
+
+# Citation values that are placeholders rather than real citations
+_PLACEHOLDER_CITATION_PATTERN = re.compile(r"No citation available|processing failed")
+
+# Excel engine ('xlsxwriter' or 'openpyxl'), resolved and imported on the first
+# Excel export rather than at module import (see TableFormatter._excel_engine)
+_EXCEL_ENGINE: Optional[str] = None
+
+# Streaming xlsxwriter workbook: rows are flushed as they are written, and cell
+# text is never reinterpreted as formulas, URLs or numbers
+_XLSXWRITER_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_formulas': False,
+    'strings_to_urls': False,
+    'strings_to_numbers': False
+}
+
+# One-row fallback table, typed once at import; create_fallback_dataframe
+# copies it and sets the Event Particulars cell to the failure reason
+_FALLBACK_TEMPLATE = pd.DataFrame([{
+    _NUM_COL: 1,
+    _DATE_COL: DEFAULT_NO_DATE,
+    _PARTICULARS_COL: "Processing failed",
+    _CITATION_COL: "No citation available (processing failed)",
+    _DOC_COL: "Unknown document"
+}])
+_FALLBACK_REASON_POS = FIVE_COLUMN_HEADERS.index(_PARTICULARS_COL)
+
+# Metadata sheet layout: (label, metadata key, value formatter). A None key is a
+# spacer row; a None formatter shows the raw value ('' when missing).
+_METADATA_SPACER = ("", None, None)
+_METADATA_ROW_SPEC = [
+    ("Pipeline ID", "run_id", None),
+    ("Timestamp", "timestamp", None),
+    _METADATA_SPACER,
+    ("Parser", "parser_name", None),
+    ("Parser Version", "parser_version", lambda v: v or 'N/A'),
+    ("Provider", "provider_name", None),
+    ("Model", "provider_model", None),
+    _METADATA_SPACER,
+    ("OCR Engine", "ocr_engine", lambda v: v or 'None'),
+    ("Table Mode", "table_mode", None),
+    ("Environment", "environment", None),
+    ("Session Label", "session_label", lambda v: v or '(none)'),
+    _METADATA_SPACER,
+    ("Input Filename", "input_filename", None),
+    ("Input Size (bytes)", "input_size_bytes", lambda v: f"{v:,}" if v else ''),
+    ("Input Pages", "input_pages", lambda v: v or 'N/A'),
+    _METADATA_SPACER,
+    ("Docling Time (seconds)", "docling_seconds", lambda v: f"{v:.3f}" if v else ''),
+    ("Extractor Time (seconds)", "extractor_seconds", lambda v: f"{v:.3f}" if v else ''),
+    ("Total Time (seconds)", "total_seconds", lambda v: f"{v:.3f}" if v else ''),
+    _METADATA_SPACER,
+    ("Events Extracted", "events_extracted", None),
+    ("Citations Found", "citations_found", None),
+    ("Avg Detail Length (chars)", "avg_detail_length", lambda v: f"{v:.0f}" if v else ''),
+    _METADATA_SPACER,
+    ("Status", "status", None),
+    ("Error Message", "error_message", lambda v: v or '(none)'),
+]
+
+# Performance metric columns preserved alongside the core five
+_TIMING_COLUMNS = ["docling_seconds", "extractor_seconds", "total_seconds"]
+
+# Display names for the timing columns (capitalized words, e.g. Docling_Seconds)
+_TIMING_DISPLAY_NAMES = {
+    col: col.replace("_", " ").title().replace(" ", "_") for col in _TIMING_COLUMNS
+}
+
 
 class TableFormatter:
     """
@@ -34,45 +130,48 @@ class TableFormatter:
             return pd.DataFrame(columns=FIVE_COLUMN_HEADERS)
 
         try:
-            # Create DataFrame from records
-            df = pd.DataFrame(records)
-
-            # Ensure all required internal fields exist
-            for field in INTERNAL_FIELDS:
-                if field not in df.columns:
-                    logger.warning(f"⚠️ Missing field {field} - adding default values")
-                    if field == "number":
-                        df[field] = range(1, len(df) + 1)
-                    elif field == "date":
-                        df[field] = DEFAULT_NO_DATE
-                    elif field == "event_particulars":
-                        df[field] = "Event details not available"
-                    elif field == "citation":
-                        df[field] = "No citation available"
-                    elif field == "document_reference":
-                        df[field] = "Unknown document"
-
-            # Preserve timing columns if present (performance metrics)
-            timing_columns = ["docling_seconds", "extractor_seconds", "total_seconds"]
-            timing_data = {}
-            for col in timing_columns:
-                if col in df.columns:
-                    timing_data[col] = df[col]
-
-            # Select and reorder core columns to match internal field order
-            core_df = df[INTERNAL_FIELDS].copy()
-
-            # Rename columns to display headers
-            core_df.columns = FIVE_COLUMN_HEADERS
-
-            # Add timing columns back if they were present
-            for col, data in timing_data.items():
-                # Convert column name to display format (capitalize words)
-                display_col = col.replace("_", " ").title().replace(" ", "_")
-                core_df[display_col] = data
-
-            # Sort by number column
-            core_df = core_df.sort_values(FIVE_COLUMN_HEADERS[0]).reset_index(drop=True)
+            # Build the display columns directly in one pass over the records
+            # (no intermediate DataFrame of every record key, no column copy)
+            columns = {header: [] for header in FIVE_COLUMN_HEADERS}
+            core_columns = [(field, columns[header]) for field, header in zip(INTERNAL_FIELDS, FIVE_COLUMN_HEADERS)]
+            timing_values = {col: [] for col in _TIMING_COLUMNS}
+            timing_seen = set()
+            missing = dict.fromkeys(INTERNAL_FIELDS, 0)
+
+            for position, record in enumerate(records, start=1):
+                for field, values in core_columns:
+                    if field in record:
+                        values.append(record[field])
+                    else:
+                        missing[field] += 1
+                        values.append(position if field == "number" else _FIELD_DEFAULTS[field])
+
+                for col, values in timing_values.items():
+                    if col in record:
+                        timing_seen.add(col)
+                    values.append(record.get(col))
+
+            for field, count in missing.items():
+                if count:
+                    logger.warning(f"⚠️ Missing field {field} in {count} records - adding default values")
+
+            # Keep timing columns if present (performance metrics), under display names
+            for col, values in timing_values.items():
+                if col in timing_seen:
+                    columns[_TIMING_DISPLAY_NAMES[col]] = values
+
+            # Few source documents per table: store Document Reference as a categorical
+            # (one string per document plus small integer codes per row)
+            columns[_DOC_COL] = pd.Categorical(columns[_DOC_COL])
+
+            # Lists let pandas infer dtypes exactly as pd.DataFrame(records) did
+            core_df = pd.DataFrame(columns)
+
+            # Sort by number column; records usually arrive in order, so check first
+            numbers = core_df[_NUM_COL]
+            if not numbers.is_monotonic_increasing:
+                order = np.argsort(numbers.to_numpy(), kind='stable')
+                core_df = core_df.take(order).reset_index(drop=True)
 
             # Validate final format (allows extra columns beyond the core 5)
             if not TableFormatter.validate_dataframe_format(core_df):
@@ -92,6 +191,10 @@ class TableFormatter:
         Validate that DataFrame contains required five-column format
         (allows extra columns like timing metrics)
 
+        A passing frame is stamped in df.attrs and not rescanned while its
+        length, core headers and core dtypes are unchanged, so edits to
+        individual cells after validation are not re-checked.
+
         Args:
             df: DataFrame to validate
 
@@ -101,34 +204,56 @@ class TableFormatter:
         if df is None or df.empty:
             return False
 
+        # Skip the rescan for a frame this function already validated. attrs are
+        # copied onto derived frames, so the stamp includes the frame's identity;
+        # the core dtypes catch in-place column replacement (df[col] = ...).
+        # Cell-level edits that keep every dtype are not detected.
+        first_five = tuple(df.columns[:5])  # O(5) Index slice, however wide the frame is
+        stamp = (id(df), len(df), first_five, tuple(df.dtypes.iloc[:5]))
+        if df.attrs.get('_tf_validated') == stamp:
+            return True
+
         # Check that core columns exist and are in correct order at the start
-        df_columns = list(df.columns)
-        if len(df_columns) < len(FIVE_COLUMN_HEADERS):
-            logger.error(f"❌ Missing core columns. Expected at least: {FIVE_COLUMN_HEADERS}, Got: {df_columns}")
+        if len(df.columns) < len(FIVE_COLUMN_HEADERS):
+            logger.error(f"❌ Missing core columns. Expected at least: {FIVE_COLUMN_HEADERS}, Got: {df.columns.tolist()}")
             return False
 
         # Check first 5 columns match the required headers
-        if df_columns[:5] != FIVE_COLUMN_HEADERS:
-            logger.error(f"❌ Core columns mismatch. Expected first 5: {FIVE_COLUMN_HEADERS}, Got: {df_columns[:5]}")
+        if first_five != _HEADERS_TUPLE:
+            logger.error(f"❌ Core columns mismatch. Expected first 5: {FIVE_COLUMN_HEADERS}, Got: {list(first_five)}")
             return False
 
         # Check required columns have data
         for col in FIVE_COLUMN_HEADERS:
-            if df[col].isnull().all():
+            if not TableFormatter._column_has_data(df[col]):
                 logger.error(f"❌ Column {col} has no data")
                 return False
 
         # Check number column contains valid integers
         try:
-            if not df[FIVE_COLUMN_HEADERS[0]].dtype.kind in 'iu':  # integer or unsigned int
+            if not df[_NUM_COL].dtype.kind in 'iu':  # integer or unsigned int
                 logger.error(f"❌ Number column contains non-integer values")
                 return False
         except Exception as e:
             logger.error(f"❌ Error validating number column: {e}")
             return False
 
+        df.attrs['_tf_validated'] = stamp
         return True
 
+    @staticmethod
+    def _column_has_data(column: pd.Series) -> bool:
+        """
+        True if a non-empty column holds at least one non-null value
+
+        Populated tables have a value in the first row, which answers the
+        check without a null mask over the whole column. Series.first_valid_index
+        is no shortcut here: it builds the full notna() mask before searching.
+        """
+        if pd.isna(column.iat[0]) is False:
+            return True
+        return bool(column.notna().any())
+
     @staticmethod
     def create_fallback_dataframe(reason: str = "Unknown error") -> pd.DataFrame:
         """
@@ -141,15 +266,9 @@ class TableFormatter:
         Returns:
             Valid DataFrame with one fallback record
         """
-        fallback_record = {
-            FIVE_COLUMN_HEADERS[0]: 1,  # No
-            FIVE_COLUMN_HEADERS[1]: DEFAULT_NO_DATE,  # Date
-            FIVE_COLUMN_HEADERS[2]: f"Processing failed: {reason}",  # Event Particulars
-            FIVE_COLUMN_HEADERS[3]: "No citation available (processing failed)",  # Citation
-            FIVE_COLUMN_HEADERS[4]: "Unknown document"  # Document Reference
-        }
-
-        df = pd.DataFrame([fallback_record])
+        # Copy the pre-typed one-row template and fill in the reason (no dtype inference per call)
+        df = _FALLBACK_TEMPLATE.copy()
+        df.iat[0, _FALLBACK_REASON_POS] = f"Processing failed: {reason}"
         logger.info(f"✅ Created fallback DataFrame: {reason}")
         return df
 
@@ -175,13 +294,15 @@ class TableFormatter:
             df = TableFormatter.create_fallback_dataframe("Invalid format for export")
 
         try:
-            if format_type.lower() == "xlsx":
+            export_format = format_type.lower()
+            if export_format == "xlsx":
                 return TableFormatter._export_excel_with_id(df, pipeline_id)
 
-            elif format_type.lower() == "csv":
-                return TableFormatter._export_csv_with_id(df, pipeline_id)
+            elif export_format == "csv":
+                pid_header = f"# Pipeline-ID: {pipeline_id}\n".encode('utf-8') if pipeline_id else b""
+                return TableFormatter._export_csv_with_id(df, pid_header)
 
-            elif format_type.lower() == "json":
+            elif export_format == "json":
                 return TableFormatter._export_json_with_id(df, pipeline_id)
 
             else:
@@ -194,24 +315,22 @@ class TableFormatter:
             return fallback_df.to_csv(index=False).encode('utf-8')
 
     @staticmethod
-    def _export_csv_with_id(df: pd.DataFrame, pipeline_id: Optional[str]) -> bytes:
+    def _export_csv_with_id(df: pd.DataFrame, pid_header: bytes = b"") -> bytes:
         """
         Export DataFrame as CSV with pipeline ID in comment header
 
         Args:
             df: DataFrame to export
-            pipeline_id: Pipeline ID to embed as comment
+            pid_header: Encoded "# Pipeline-ID: ..." comment line (empty for none)
 
         Returns:
             CSV data with pipeline ID comment
         """
-        csv_content = df.to_csv(index=False)
-
-        # Prepend pipeline ID as comment if available
-        if pipeline_id:
-            csv_content = f"# Pipeline-ID: {pipeline_id}\n{csv_content}"
-
-        return csv_content.encode('utf-8')
+        # Comment bytes first, then pandas writes the rows straight into the buffer
+        buffer = io.BytesIO()
+        buffer.write(pid_header)
+        df.to_csv(buffer, index=False, encoding='utf-8')
+        return buffer.getvalue()
 
     @staticmethod
     def _export_excel_with_id(df: pd.DataFrame, pipeline_id: Optional[str]) -> bytes:
@@ -225,23 +344,79 @@ class TableFormatter:
         Returns:
             Excel workbook with two sheets: Legal Events and Metadata
         """
-        import io
-
         buffer = io.BytesIO()
+        metadata_dict = df.attrs.get('metadata')
+        engine = TableFormatter._excel_engine()
+
+        if engine == 'xlsxwriter':
+            TableFormatter._write_excel_streaming(buffer, df, metadata_dict)
+            return buffer.getvalue()
 
-        # Create Excel writer with multiple sheets
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        # Fallback: openpyxl builds the whole workbook in memory
+        with pd.ExcelWriter(buffer, engine=engine) as writer:
             # Sheet 1: Legal Events (main data)
             df.to_excel(writer, sheet_name='Legal Events', index=False)
 
             # Sheet 2: Metadata (if available from DataFrame attrs)
-            metadata_dict = df.attrs.get('metadata')
             if metadata_dict:
                 metadata_df = TableFormatter._format_metadata_for_excel(metadata_dict)
                 metadata_df.to_excel(writer, sheet_name='Metadata', index=False, header=False)
 
         return buffer.getvalue()
 
+    @staticmethod
+    def _excel_engine() -> str:
+        """Excel engine for exports: xlsxwriter when installed, else openpyxl (resolved once)"""
+        global _EXCEL_ENGINE
+        if _EXCEL_ENGINE is None:
+            try:
+                import xlsxwriter  # noqa: F401
+                _EXCEL_ENGINE = 'xlsxwriter'
+            except ImportError:
+                logger.warning("⚠️ xlsxwriter not available - Excel exports will use openpyxl")
+                _EXCEL_ENGINE = 'openpyxl'
+        return _EXCEL_ENGINE
+
+    @staticmethod
+    def _write_excel_streaming(buffer: io.BytesIO, df: pd.DataFrame, metadata: Optional[Dict[str, Any]]) -> None:
+        """
+        Write the Excel export row by row with xlsxwriter in constant_memory mode
+
+        constant_memory only accepts cells on the current row, while
+        DataFrame.to_excel emits cells column by column, so rows are written
+        here directly. Sheets and layout match the openpyxl export.
+
+        Args:
+            buffer: Output buffer for the workbook
+            df: DataFrame to export
+            metadata: Optional pipeline metadata for the Metadata sheet
+        """
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(buffer, _XLSXWRITER_OPTIONS)
+        try:
+            # Sheet 1: Legal Events (main data), header styled like pandas' default
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            sheet = workbook.add_worksheet('Legal Events')
+            sheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+
+            # tolist() yields plain Python values; missing cells (None/NaN/pd.NA/NaT) stay blank as in to_excel
+            columns = [df[col].tolist() for col in df.columns]
+            for row_idx, row in enumerate(zip(*columns), start=1):
+                for col_idx, value in enumerate(row):
+                    if pd.isna(value):
+                        continue
+                    sheet.write(row_idx, col_idx, value)
+
+            # Sheet 2: Metadata (if available from DataFrame attrs)
+            if metadata:
+                metadata_sheet = workbook.add_worksheet('Metadata')
+                metadata_df = TableFormatter._format_metadata_for_excel(metadata)
+                for row_idx, row in enumerate(metadata_df.itertuples(index=False, name=None)):
+                    metadata_sheet.write_row(row_idx, 0, row)
+        finally:
+            workbook.close()
+
     @staticmethod
     def _format_metadata_for_excel(metadata: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -254,36 +429,11 @@ class TableFormatter:
             DataFrame with Property and Value columns
         """
         rows = [
-            ("Pipeline ID", metadata.get('run_id', '')),
-            ("Timestamp", metadata.get('timestamp', '')),
-            ("", ""),  # Spacer
-            ("Parser", metadata.get('parser_name', '')),
-            ("Parser Version", metadata.get('parser_version', '') or 'N/A'),
-            ("Provider", metadata.get('provider_name', '')),
-            ("Model", metadata.get('provider_model', '')),
-            ("", ""),  # Spacer
-            ("OCR Engine", metadata.get('ocr_engine', '') or 'None'),
-            ("Table Mode", metadata.get('table_mode', '')),
-            ("Environment", metadata.get('environment', '')),
-            ("Session Label", metadata.get('session_label', '') or '(none)'),
-            ("", ""),  # Spacer
-            ("Input Filename", metadata.get('input_filename', '')),
-            ("Input Size (bytes)", f"{metadata.get('input_size_bytes', 0):,}" if metadata.get('input_size_bytes') else ''),
-            ("Input Pages", metadata.get('input_pages', '') or 'N/A'),
-            ("", ""),  # Spacer
-            ("Docling Time (seconds)", f"{metadata.get('docling_seconds', 0):.3f}" if metadata.get('docling_seconds') else ''),
-            ("Extractor Time (seconds)", f"{metadata.get('extractor_seconds', 0):.3f}" if metadata.get('extractor_seconds') else ''),
-            ("Total Time (seconds)", f"{metadata.get('total_seconds', 0):.3f}" if metadata.get('total_seconds') else ''),
-            ("", ""),  # Spacer
-            ("Events Extracted", metadata.get('events_extracted', '')),
-            ("Citations Found", metadata.get('citations_found', '')),
-            ("Avg Detail Length (chars)", f"{metadata.get('avg_detail_length', 0):.0f}" if metadata.get('avg_detail_length') else ''),
-            ("", ""),  # Spacer
-            ("Status", metadata.get('status', '')),
-            ("Error Message", metadata.get('error_message', '') or '(none)'),
+            (label, "" if key is None else (fmt(metadata.get(key)) if fmt else metadata.get(key, '')))
+            for label, key, fmt in _METADATA_ROW_SPEC
         ]
 
-        return pd.DataFrame(rows, columns=['Property', 'Value'])
+        return pd.DataFrame.from_records(rows, columns=['Property', 'Value'])
 
     @staticmethod
     def _export_json_with_id(df: pd.DataFrame, pipeline_id: Optional[str]) -> bytes:
@@ -297,9 +447,9 @@ class TableFormatter:
         Returns:
             JSON with pipeline_id field and legal_events array
         """
-        import json
-
-        records = df.to_dict(orient='records')
+        # Row dicts built from per-column tolist() (plain Python values) instead of to_dict(orient='records')
+        columns = df.columns.tolist()
+        records = [dict(zip(columns, row)) for row in zip(*(df[col].tolist() for col in columns))]
 
         # Wrap with pipeline_id if available
         if pipeline_id:
@@ -311,6 +461,10 @@ class TableFormatter:
             # Fallback to plain array if no pipeline_id
             output = records
 
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(output, option=orjson.OPT_INDENT_2)
+
+        import json
         return json.dumps(output, indent=2).encode('utf-8')
 
     @staticmethod
@@ -335,18 +489,16 @@ class TableFormatter:
         try:
             # Calculate statistics
             total_events = len(df)
-            unique_docs = df[FIVE_COLUMN_HEADERS[4]].nunique()  # Document Reference
+            # On a categorical column nunique works on the integer codes. Counting
+            # categories instead would include documents filtered out of this frame.
+            unique_docs = df[_DOC_COL].nunique()
 
             # Count events with real citations (not default)
-            citation_col = FIVE_COLUMN_HEADERS[3]  # Citation
-            events_with_citations = len(df[
-                (~df[citation_col].str.contains("No citation available", na=False)) &
-                (~df[citation_col].str.contains("processing failed", na=False))
-            ])
+            placeholder = df[_CITATION_COL].str.contains(_PLACEHOLDER_CITATION_PATTERN, na=False)
+            events_with_citations = int((~placeholder).sum())
 
             # Average length of event particulars
-            particulars_col = FIVE_COLUMN_HEADERS[2]  # Event Particulars
-            avg_length = df[particulars_col].str.len().mean()
+            avg_length = df[_PARTICULARS_COL].str.len().mean()
 
             return {
                 "total_events": total_events,
@@ -0,0 +1,35 @@
+"""Composite indexes for run-ordered events and case-scoped lookups
+
+Revision ID: 002_query_indexes
+Revises: 001_initial_schema
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '002_query_indexes'
+down_revision = '001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Events are read per run in number order; (run_id, number) serves the
+    # ORDER BY from the index and also covers plain run_id lookups
+    op.create_index('idx_event_run_number', 'events', ['run_id', 'number'], unique=False)
+    op.drop_index('idx_event_run', table_name='events')
+
+    # documents.case_id is a foreign key filtered on with no index of its own
+    op.create_index('idx_doc_case', 'documents', ['case_id'], unique=False)
+
+    # Newest-first run listings per case (dashboard)
+    op.create_index('idx_run_case_created', 'runs', ['case_id', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_run_case_created', table_name='runs')
+    op.drop_index('idx_doc_case', table_name='documents')
+    op.create_index('idx_event_run', 'events', ['run_id'], unique=False)
+    op.drop_index('idx_event_run_number', table_name='events')
@@ -0,0 +1,36 @@
+"""BRIN indexes for created_at range scans on runs and events
+
+Revision ID: 003_brin_created_at
+Revises: 002_query_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '003_brin_created_at'
+down_revision = '002_query_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # runs and events are append-only, so created_at follows physical row order.
+    # A BRIN index keeps min/max per block range: a fraction of the btree's size,
+    # and "last N days" range scans skip every block range outside the window.
+    op.drop_index('idx_run_created', table_name='runs')
+    op.create_index(
+        'idx_run_created', 'runs', ['created_at'], unique=False,
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+    op.create_index(
+        'idx_event_created', 'events', ['created_at'], unique=False,
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_event_created', table_name='events')
+    op.drop_index('idx_run_created', table_name='runs')
+    op.create_index('idx_run_created', 'runs', ['created_at'], unique=False)
@@ -0,0 +1,44 @@
+"""Store run metadata and model badges as JSONB
+
+Revision ID: 004_jsonb_columns
+Revises: 003_brin_created_at
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic
+revision = '004_jsonb_columns'
+down_revision = '003_brin_created_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # json keeps the raw text and reparses it on every read; jsonb is stored
+    # decoded and supports containment operators and GIN indexes
+    op.alter_column(
+        'runs', 'metadata',
+        type_=postgresql.JSONB(), existing_type=sa.JSON(), existing_nullable=True,
+        postgresql_using='metadata::jsonb'
+    )
+    op.alter_column(
+        'model_catalog', 'badges',
+        type_=postgresql.JSONB(), existing_type=sa.JSON(), existing_nullable=True,
+        postgresql_using='badges::jsonb'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'model_catalog', 'badges',
+        type_=sa.JSON(), existing_type=postgresql.JSONB(), existing_nullable=True,
+        postgresql_using='badges::json'
+    )
+    op.alter_column(
+        'runs', 'metadata',
+        type_=sa.JSON(), existing_type=postgresql.JSONB(), existing_nullable=True,
+        postgresql_using='metadata::json'
+    )
@@ -0,0 +1,94 @@
+"""Hash-partition the events table by run_id
+
+Revision ID: 005_partition_events
+Revises: 004_jsonb_columns
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '005_partition_events'
+down_revision = '004_jsonb_columns'
+branch_labels = None
+depends_on = None
+
+# Number of hash partitions (keep in sync with EVENT_PARTITIONS in api/models.py)
+EVENT_PARTITIONS = 8
+
+_EVENT_COLUMNS = (
+    'id, run_id, document_id, number, date, event_particulars, citation, '
+    'document_reference, confidence_score, created_at'
+)
+
+
+def _event_columns():
+    """Column definitions shared by the partitioned and plain events tables"""
+    return [
+        # Keep drawing ids from the existing serial sequence
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('events_id_seq')"), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('number', sa.Integer(), nullable=True),
+        sa.Column('date', sa.String(length=100), nullable=True),
+        sa.Column('event_particulars', sa.Text(), nullable=False),
+        sa.Column('citation', sa.Text(), nullable=True),
+        sa.Column('document_reference', sa.String(length=255), nullable=True),
+        sa.Column('confidence_score', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    ]
+
+
+def _swap_events_table(new_table: str, primary_key: list) -> None:
+    """Copy events into new_table, drop the old table and take over its name, keys and indexes"""
+    op.execute(f'INSERT INTO {new_table} ({_EVENT_COLUMNS}) SELECT {_EVENT_COLUMNS} FROM events')
+
+    # Detach the id sequence so it survives dropping the old table
+    op.execute('ALTER SEQUENCE events_id_seq OWNED BY NONE')
+    op.drop_table('events')
+    op.rename_table(new_table, 'events')
+    op.execute('ALTER SEQUENCE events_id_seq OWNED BY events.id')
+
+    # Constraints and indexes are created after the rename so they keep their original names
+    op.create_primary_key('events_pkey', 'events', primary_key)
+    op.create_foreign_key(
+        'events_run_id_fkey', 'events', 'runs', ['run_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'events_document_id_fkey', 'events', 'documents', ['document_id'], ['id'], ondelete='CASCADE'
+    )
+    op.create_index('idx_event_run_number', 'events', ['run_id', 'number'], unique=False)
+    op.create_index('idx_event_document', 'events', ['document_id'], unique=False)
+    op.create_index('idx_event_date', 'events', ['date'], unique=False)
+    op.create_index(
+        'idx_event_created', 'events', ['created_at'], unique=False,
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+
+
+def upgrade() -> None:
+    # Every event query filters on run_id. With hash partitions the planner prunes
+    # to one child table, so each scan and index covers ~1/N of all events.
+    # Hash (not monthly range) partitions need no ongoing partition maintenance,
+    # and deleting a run still cascades through the run_id foreign key.
+    # A partitioned table's primary key must include the partition key.
+    op.create_table(
+        'events_partitioned',
+        *_event_columns(),
+        postgresql_partition_by='HASH (run_id)'
+    )
+    for remainder in range(EVENT_PARTITIONS):
+        op.execute(
+            f'CREATE TABLE events_p{remainder} PARTITION OF events_partitioned '
+            f'FOR VALUES WITH (MODULUS {EVENT_PARTITIONS}, REMAINDER {remainder})'
+        )
+
+    _swap_events_table('events_partitioned', ['id', 'run_id'])
+
+
+def downgrade() -> None:
+    op.create_table('events_unpartitioned', *_event_columns())
+
+    # Dropping the partitioned parent also drops its events_p* partitions
+    _swap_events_table('events_unpartitioned', ['id'])
@@ -5,6 +5,7 @@ Verifies that all components are working correctly
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import sys
 import json
@@ -12,6 +13,10 @@ from datetime import datetime
 
 API_URL = "http://localhost:8000"
 
+# One keep-alive connection pool shared by every check
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 def colored_print(text, color="default"):
     """Print colored text"""
     colors = {
@@ -27,7 +32,7 @@ def test_health():
     """Test health endpoint"""
     print("\n1. Testing Health Endpoint...")
     try:
-        response = requests.get(f"{API_URL}/health")
+        response = SESSION.get(f"{API_URL}/health")
         if response.status_code == 200:
             health = response.json()
             if health["status"] == "healthy":
@@ -55,7 +60,7 @@ def test_client_creation():
             "name": f"Test Client {datetime.now().strftime('%Y%m%d_%H%M%S')}",
             "reference_code": f"TEST-{int(time.time())}"
         }
-        response = requests.post(f"{API_URL}/v1/clients", json=data)
+        response = SESSION.post(f"{API_URL}/v1/clients", json=data)
         
         if response.status_code == 200:
             client = response.json()
@@ -77,7 +82,7 @@ def test_case_creation(client_id):
             "name": f"Test Case {datetime.now().strftime('%Y%m%d_%H%M%S')}",
             "description": "Automated test case"
         }
-        response = requests.post(f"{API_URL}/v1/cases", json=data)
+        response = SESSION.post(f"{API_URL}/v1/cases", json=data)
         
         if response.status_code == 200:
             case = response.json()
@@ -100,7 +105,7 @@ def test_run_creation(case_id):
             "model": "meta-llama/llama-3.3-70b-instruct",
             "file_count": 1
         }
-        response = requests.post(f"{API_URL}/v1/runs", json=data)
+        response = SESSION.post(f"{API_URL}/v1/runs", json=data)
         
         if response.status_code == 200:
             run = response.json()
@@ -118,7 +123,7 @@ def test_run_status(run_id):
     """Test run status endpoint"""
     print("\n5. Testing Run Status...")
     try:
-        response = requests.get(f"{API_URL}/v1/runs/{run_id}")
+        response = SESSION.get(f"{API_URL}/v1/runs/{run_id}")
         
         if response.status_code == 200:
             run = response.json()
@@ -136,7 +141,7 @@ def test_models_endpoint():
     """Test models catalog endpoint"""
     print("\n6. Testing Models Catalog...")
     try:
-        response = requests.get(f"{API_URL}/v1/models")
+        response = SESSION.get(f"{API_URL}/v1/models")
         
         if response.status_code == 200:
             models = response.json()
@@ -155,7 +160,7 @@ def test_database_connection():
     """Test database by listing clients"""
     print("\n7. Testing Database Connection...")
     try:
-        response = requests.get(f"{API_URL}/v1/clients")
+        response = SESSION.get(f"{API_URL}/v1/clients")
         
         if response.status_code == 200:
             clients = response.json()
@@ -5,7 +5,9 @@ Runs RQ worker to process document extraction jobs
 
 import os
 import logging
+import multiprocessing
 import sys
+import time
 from rq import Worker, Queue, Connection
 import redis
 
@@ -22,40 +24,86 @@ logger = logging.getLogger(__name__)
 # Redis connection
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 
+# Queues to listen to (in priority order)
+QUEUE_NAMES = ["high", "default", "low"]
 
-def main():
-    """
-    Main worker entry point
+# Number of worker processes, each consuming jobs independently
+WORKER_PROCS = int(os.getenv("WORKER_PROCS", str(os.cpu_count() or 1)))
+
+# Seconds between checks for worker processes that have exited
+SUPERVISE_INTERVAL = 5
+
+
+def run_worker(index: int = 0):
     """
-    logger.info("🚀 Starting Legal Events Worker...")
+    Run one RQ worker until it stops
+    
+    Each process builds its own Redis connection and queues, since
+    connections do not survive a fork cleanly.
     
+    Args:
+        index: Worker number, used to keep worker names unique
+    """
     # Connect to Redis
     redis_conn = redis.from_url(REDIS_URL)
     
-    # Define queues to listen to (in priority order)
-    queues = [
-        Queue("high", connection=redis_conn),
-        Queue("default", connection=redis_conn),
-        Queue("low", connection=redis_conn),
-    ]
-    
-    logger.info(f"📋 Listening to queues: {[q.name for q in queues]}")
+    queues = [Queue(name, connection=redis_conn) for name in QUEUE_NAMES]
     
     # Create and start worker
     with Connection(redis_conn):
         worker = Worker(
             queues,
-            name="legal-events-worker",
+            # The pid keeps a restarted worker from clashing with a stale registration
+            name=f"legal-events-worker-{index}-{os.getpid()}",
             log_job_description=True,
             max_jobs=100,  # Process 100 jobs before restarting
         )
         
-        logger.info("✅ Worker ready and listening for jobs...")
+        logger.info(f"✅ Worker {index} ready and listening for jobs...")
         
-        # Start working
+        # Start working (RQ lets only one worker run the scheduler at a time)
         worker.work(with_scheduler=True)
 
 
+def _start_worker_process(index: int) -> multiprocessing.Process:
+    """Start run_worker in a new process"""
+    proc = multiprocessing.Process(target=run_worker, args=(index,), name=f"legal-events-worker-{index}")
+    proc.start()
+    return proc
+
+
+def main():
+    """
+    Main worker entry point
+    """
+    logger.info("🚀 Starting Legal Events Worker...")
+    logger.info(f"📋 Listening to queues: {QUEUE_NAMES}")
+    
+    if WORKER_PROCS <= 1:
+        run_worker()
+        return
+    
+    # One worker per process so jobs run in parallel across cores
+    logger.info(f"🧵 Starting {WORKER_PROCS} worker processes")
+    procs = [_start_worker_process(index) for index in range(WORKER_PROCS)]
+    
+    # Workers exit after max_jobs (or on a crash); replace them so capacity stays constant
+    try:
+        while True:
+            time.sleep(SUPERVISE_INTERVAL)
+            for index, proc in enumerate(procs):
+                if not proc.is_alive():
+                    proc.join()
+                    logger.info(f"🔄 Worker {index} exited (code {proc.exitcode}) - restarting")
+                    procs[index] = _start_worker_process(index)
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        for proc in procs:
+            proc.join()
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -4,14 +4,33 @@ Processes documents using the existing legal pipeline
 """
 
 import os
+import functools
+import hashlib
 import logging
+import mmap
 import tempfile
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+import io
 import pandas as pd
 import json
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, joinedload
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 
 # Import existing pipeline
 import sys
@@ -22,14 +41,384 @@ from core.constants import FIVE_COLUMN_HEADERS
 # Import v2 components
 from ..api.database import SessionLocal
 from ..api.models import (
-    Run, RunStatus, Document, DocumentStatus, Event, Artifact,
-    Case, Client
+    Run, RunStatus, Document, DocumentStatus, Event, Artifact, Case
 )
-from ..api.storage import MinioStorage
+from ..api.storage import MinioStorage, get_storage
 from ..api.queue import JobProgress
 
 logger = logging.getLogger(__name__)
 
+# Documents of a run processed concurrently. Each thread keeps its own pipeline
+# (and Docling converter, which is CPU-bound), so this stays small; the overlap
+# it buys is mostly one document's LLM call against another's conversion.
+DOC_CONCURRENCY = int(os.getenv("WORKER_DOC_CONCURRENCY", "2"))
+
+# Copy the first 10k chars of extracted text onto each document row. Nothing reads
+# it back yet, so it is off by default to keep document rows and WAL volume small.
+STORE_EXTRACTED_TEXT = os.getenv("WORKER_STORE_EXTRACTED_TEXT", "false").lower() == "true"
+
+# Runs whose storage objects are deleted concurrently in cleanup_old_runs
+CLEANUP_CONCURRENCY = 16
+
+# Processed documents written per database transaction
+COMMIT_BATCH_SIZE = 25
+
+# Part of every extraction cache key; bump it to invalidate all cached extractions
+EXTRACTION_CACHE_VERSION = os.getenv("WORKER_EXTRACTION_CACHE_VERSION", "1")
+
+# Streaming xlsxwriter workbook; cell text is written literally (no formula/URL/number conversion)
+_XLSXWRITER_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_formulas': False,
+    'strings_to_urls': False,
+    'strings_to_numbers': False
+}
+
+class FileWrapper:
+    """
+    Downloaded document exposed like an uploaded file (name + getbuffer())
+    
+    The file is memory-mapped once and getbuffer() returns a zero-copy
+    memoryview of the mapping, instead of reading the whole PDF into bytes
+    on every call.
+    """
+    
+    def __init__(self, path: str, name: str):
+        self.name = name
+        self._file = open(path, 'rb')
+        # mmap rejects empty files; fall back to an empty buffer
+        if os.fstat(self._file.fileno()).st_size:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mm)
+        else:
+            self._mm = None
+            self._view = memoryview(b"")
+    
+    def getbuffer(self) -> memoryview:
+        return self._view
+    
+    def close(self):
+        self._view.release()
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # A caller still holds a slice of the view; unmapped when it is collected
+                pass
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __del__(self):
+        if not self._file.closed:
+            self.close()
+
+
+# Each worker thread keeps its own pipeline; instances are not shared across threads
+_thread_state = threading.local()
+
+# Document executor shared by every run in this process, so its threads (and
+# their pipelines) outlive a single run. Created on first use, after any fork.
+_doc_executor: Optional[ThreadPoolExecutor] = None
+_doc_executor_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_pipeline(provider: str, model: Optional[str]) -> LegalEventsPipeline:
+    """Shared pipeline per (provider, model) for single-document jobs"""
+    return LegalEventsPipeline(
+        event_extractor=provider,
+        runtime_model=model
+    )
+
+
+def _thread_pipeline(provider: str, model: Optional[str]) -> LegalEventsPipeline:
+    """Pipeline for the current thread, rebuilt when the provider/model changes"""
+    key = (provider, model)
+    if getattr(_thread_state, "pipeline_key", None) != key:
+        _thread_state.pipeline = LegalEventsPipeline(
+            event_extractor=provider,
+            runtime_model=model
+        )
+        _thread_state.pipeline_key = key
+    return _thread_state.pipeline
+
+
+def _resolved_model(pipeline: LegalEventsPipeline, model: Optional[str]) -> str:
+    """Model the pipeline's event extractor actually calls (env/config default when model is None)"""
+    config = getattr(pipeline.event_extractor, "config", None)
+    for attr in ("active_model", "model", "model_id"):
+        value = getattr(config, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return model or pipeline.event_extractor.__class__.__name__
+
+
+def _get_doc_executor() -> ThreadPoolExecutor:
+    """Process-wide executor for document extraction (DOC_CONCURRENCY threads)"""
+    global _doc_executor
+    with _doc_executor_lock:
+        if _doc_executor is None:
+            _doc_executor = ThreadPoolExecutor(max_workers=max(1, DOC_CONCURRENCY), thread_name_prefix="doc")
+        return _doc_executor
+
+
+def _extraction_cache_key(digest: str, provider: str, model: str) -> str:
+    """Storage key of the cached extraction for a file digest and provider/resolved model"""
+    return f"cache/extracts/v{EXTRACTION_CACHE_VERSION}/{digest}/{provider}/{model.replace('/', '_')}.json"
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available); unknown types become strings"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
+    return json.dumps(payload, default=str).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _process_with_cache(
+    pipeline: LegalEventsPipeline,
+    file_obj: FileWrapper,
+    storage: MinioStorage,
+    provider: str,
+    model: Optional[str],
+    case_name: str,
+    use_cache: bool = True
+) -> tuple:
+    """
+    Run the pipeline on a file, reusing a cached extraction of identical content
+    
+    Extractions are stored in MinIO keyed by the file's SHA-256 plus
+    provider and resolved model, so re-uploads and reprocessing of the same
+    document skip Docling and the LLM call. Failed, partial and empty
+    extractions are not cached.
+    
+    Args:
+        pipeline: Pipeline used on a cache miss
+        file_obj: Mapped document file
+        storage: MinIO storage holding the cache
+        provider: LLM provider (part of the cache key)
+        model: Requested model (None = the extractor's configured default)
+        case_name: Case name passed to the pipeline
+        use_cache: Read cached extractions; False always re-extracts and
+            refreshes the cache entry
+        
+    Returns:
+        Tuple of (events DataFrame, metadata)
+    """
+    digest = hashlib.sha256(file_obj.getbuffer()).hexdigest()
+    cache_key = _extraction_cache_key(digest, provider, _resolved_model(pipeline, model))
+    
+    cached = storage.download_bytes_if_exists(cache_key) if use_cache else None
+    if cached is not None:
+        try:
+            payload = _json_loads(cached)
+            metadata = payload["metadata"]
+            # Timings belong to the original extraction; nothing was spent on them here
+            if isinstance(metadata, dict):
+                metadata.pop("performance", None)
+            logger.info(f"💾 Extraction cache HIT: {file_obj.name} ({digest[:12]})")
+            return pd.DataFrame(payload["events"]), metadata
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable extraction cache entry {cache_key}: {e}")
+    
+    df, metadata = pipeline.process_documents(
+        [file_obj],
+        case_name=case_name
+    )
+    
+    status = metadata.get("status") if isinstance(metadata, dict) else None
+    if status is None:
+        status = df.attrs.get("metadata", {}).get("status")
+    if status not in ("failed", "partial") and not df.empty:
+        payload = {"events": df.to_dict(orient="records"), "metadata": metadata}
+        storage.upload_bytes(cache_key, _json_dumps(payload), "application/json")
+    
+    return df, metadata
+
+
+def _extract_one_doc(
+    run_id: int,
+    storage_key: str,
+    filename: str,
+    provider: str,
+    model: Optional[str],
+    storage: MinioStorage
+) -> Dict[str, Any]:
+    """
+    Download and run the pipeline on one document (called from a worker thread)
+    
+    No database access happens here; the caller persists the result.
+    
+    Args:
+        run_id: Run the document belongs to
+        storage_key: Object key of the document in MinIO
+        filename: Original filename
+        provider: LLM provider to use
+        model: Specific model to use
+        storage: Shared MinIO storage (the client is thread-safe)
+        
+    Returns:
+        Dictionary with the events DataFrame, pipeline metadata and
+        processing time, or the error message if processing failed
+    """
+    try:
+        logger.info(f"Processing document: {filename}")
+        pipeline = _thread_pipeline(provider, model)
+        
+        # Download document from storage
+        with tempfile.NamedTemporaryFile(suffix=os.path.splitext(filename)[1]) as tmp_file:
+            # Download from MinIO
+            storage.download_file(storage_key, tmp_file.name)
+            
+            # Process with pipeline
+            start_time = time.time()
+            
+            # Process single document (or reuse a cached extraction of the same file)
+            with FileWrapper(tmp_file.name, filename) as file_obj:
+                df, metadata = _process_with_cache(
+                    pipeline, file_obj, storage, provider, model,
+                    case_name=f"Run_{run_id}"
+                )
+            
+            processing_time = time.time() - start_time
+        
+        return {"df": df, "metadata": metadata, "processing_time": processing_time, "error": None}
+    
+    except Exception as e:
+        logger.error(f"❌ Failed to process {filename}: {str(e)}")
+        return {"df": None, "metadata": None, "processing_time": 0, "error": str(e)}
+
+
+def _build_events(df: pd.DataFrame, run_id: int, document_id: int, filename: str) -> List[Event]:
+    """
+    Convert a pipeline events DataFrame into Event rows
+    
+    Reads each column once as a list instead of building a Series per row.
+    Missing columns become empty strings.
+    
+    Args:
+        df: Events DataFrame from the pipeline
+        run_id: Run the events belong to
+        document_id: Source document ID
+        filename: Source document filename (used as document reference)
+        
+    Returns:
+        List of Event objects numbered from 1
+    """
+    n = len(df)
+    
+    def column(name: str) -> list:
+        if name not in df.columns:
+            return [""] * n
+        return list(map(str, df[name].tolist()))
+    
+    dates = column("Date")
+    particulars = column("Event Particulars")
+    citations = column("Citation")
+    
+    return [
+        Event(
+            run_id=run_id,
+            document_id=document_id,
+            number=i + 1,
+            date=dates[i],
+            event_particulars=particulars[i],
+            citation=citations[i],
+            document_reference=filename  # Use actual filename
+        )
+        for i in range(n)
+    ]
+
+
+def _persist_doc_result(db: Session, run_id: int, doc: Document, result: Dict[str, Any]) -> Optional[int]:
+    """
+    Stage a document's extraction result in the session (no commit)
+    
+    Args:
+        db: Database session
+        run_id: Run the document belongs to
+        doc: Document row
+        result: Result from _extract_one_doc
+        
+    Returns:
+        Number of events saved, or None if extraction failed
+    """
+    if result["error"] is not None:
+        doc.status = DocumentStatus.FAILED
+        doc.error = result["error"]
+        return None
+    
+    df = result["df"]
+    metadata = result["metadata"]
+    
+    # Update document with extracted text (cache)
+    if STORE_EXTRACTED_TEXT and metadata and "extracted_text" in metadata:
+        doc.extracted_text = metadata["extracted_text"][:10000]  # Limit size
+    
+    # Save events to database
+    db.bulk_save_objects(_build_events(df, run_id, doc.id, doc.filename))
+    
+    # Update document status
+    doc.status = DocumentStatus.SUCCESS
+    doc.processed_at = datetime.utcnow()
+    doc.processing_time_seconds = result["processing_time"]
+    doc.pages = metadata.get("pages", 0) if metadata else 0
+    doc.ocr_detected = metadata.get("ocr_detected", False) if metadata else False
+    
+    logger.info(f"✅ Processed {doc.filename}: {len(df)} events extracted")
+    return len(df)
+
+
+def _commit_doc_batch(db: Session, run_id: int, batch: list, event_counts: Dict[int, int]):
+    """
+    Commit a batch of staged document results in one transaction
+    
+    If the batch commit fails, each document is retried in its own
+    transaction so one bad document does not fail the whole batch.
+    
+    Args:
+        db: Database session
+        run_id: Run the documents belong to
+        batch: (document, result) pairs already staged in the session
+        event_counts: Event count per document ID, None if failed (updated on fallback)
+    """
+    try:
+        db.commit()
+    except Exception as e:
+        logger.warning(f"⚠️ Batch commit failed ({e}) - committing {len(batch)} documents individually")
+        db.rollback()
+        _save_docs_individually(db, run_id, batch, event_counts)
+
+
+def _save_docs_individually(db: Session, run_id: int, batch: list, event_counts: Dict[int, int]):
+    """
+    Persist and commit each (document, result) pair in its own transaction
+    
+    Documents that still fail to save are marked FAILED.
+    """
+    for doc, result in batch:
+        try:
+            event_counts[doc.id] = _persist_doc_result(db, run_id, doc, result)
+            db.commit()
+        except Exception as e:
+            logger.error(f"❌ Failed to save {doc.filename}: {str(e)}")
+            db.rollback()
+            doc.status = DocumentStatus.FAILED
+            doc.error = str(e)
+            event_counts[doc.id] = None
+            db.commit()
+
 
 def process_run(run_id: int, provider: str = "openrouter", model: str = None) -> Dict[str, Any]:
     """
@@ -44,7 +433,7 @@ def process_run(run_id: int, provider: str = "openrouter", model: str = None) ->
         Result dictionary with stats
     """
     db = SessionLocal()
-    storage = MinioStorage()
+    storage = get_storage()
     
     try:
         # Get run and documents
@@ -57,7 +446,6 @@ def process_run(run_id: int, provider: str = "openrouter", model: str = None) ->
         # Update run status
         run.status = RunStatus.PROCESSING
         run.started_at = datetime.utcnow()
-        db.commit()
         
         # Get documents to process
         documents = db.query(Document).filter(
@@ -67,107 +455,78 @@ def process_run(run_id: int, provider: str = "openrouter", model: str = None) ->
         
         logger.info(f"📄 Processing {len(documents)} documents")
         
-        # Initialize pipeline with specified provider
-        pipeline = LegalEventsPipeline(
-            event_extractor=provider,
-            runtime_model=model
-        )
-        
         # Track results
         total_docs = len(documents)
-        processed = 0
-        failed = 0
-        total_events = 0
         total_docling_time = 0
         total_extractor_time = 0
+        event_counts = {}
         
-        # Process each document
+        # Identical uploads (same SHA-256 from the upload manifest) are extracted
+        # once; the first document of each group stands in for the rest
+        groups = {}
         for doc in documents:
-            try:
-                logger.info(f"Processing document: {doc.filename}")
+            groups.setdefault(doc.sha256 or f"document:{doc.id}", []).append(doc)
+        if len(groups) < total_docs:
+            logger.info(f"♻️ {total_docs - len(groups)} duplicate documents will reuse another upload's events")
+        
+        # Mark the run and every document as processing in one transaction
+        for doc in documents:
+            doc.status = DocumentStatus.PROCESSING
+        db.commit()
+        
+        # Extract documents on the process-wide executor, overlapping one
+        # document's LLM call with another's conversion. Results are written
+        # here in the parent's session, committing every COMMIT_BATCH_SIZE documents.
+        executor = _get_doc_executor()
+        futures = {
+            executor.submit(
+                _extract_one_doc, run_id, group[0].storage_key, group[0].filename, provider, model, storage
+            ): group
+            for group in groups.values()
+        }
+        try:
+            batch = []
+            for future in as_completed(futures):
+                group = futures[future]
+                result = future.result()
                 
-                # Update document status
-                doc.status = DocumentStatus.PROCESSING
-                db.commit()
+                # Extract timing from metadata
+                metadata = result["metadata"]
+                if metadata and "performance" in metadata:
+                    perf = metadata["performance"]
+                    total_docling_time += perf.get("docling_time", 0)
+                    total_extractor_time += perf.get("extractor_time", 0)
+                else:
+                    total_extractor_time += result["processing_time"]
                 
-                # Download document from storage
-                with tempfile.NamedTemporaryFile(suffix=os.path.splitext(doc.filename)[1]) as tmp_file:
-                    # Download from MinIO
-                    storage.download_file(doc.storage_key, tmp_file.name)
-                    
-                    # Create a file-like object compatible with the pipeline
-                    class FileWrapper:
-                        def __init__(self, path, name):
-                            self.name = name
-                            self._path = path
-                        
-                        def getbuffer(self):
-                            with open(self._path, 'rb') as f:
-                                return f.read()
-                    
-                    file_obj = FileWrapper(tmp_file.name, doc.filename)
-                    
-                    # Process with pipeline
-                    start_time = time.time()
-                    
-                    # Process single document
-                    df, metadata = pipeline.process_documents(
-                        [file_obj],
-                        case_name=f"Run_{run_id}"
-                    )
-                    
-                    processing_time = time.time() - start_time
-                    
-                    # Extract timing from metadata
-                    if metadata and "performance" in metadata:
-                        perf = metadata["performance"]
-                        docling_time = perf.get("docling_time", 0)
-                        extractor_time = perf.get("extractor_time", 0)
-                        total_docling_time += docling_time
-                        total_extractor_time += extractor_time
-                    else:
-                        docling_time = 0
-                        extractor_time = processing_time
-                        total_extractor_time += extractor_time
-                    
-                    # Update document with extracted text (cache)
-                    if metadata and "extracted_text" in metadata:
-                        doc.extracted_text = metadata["extracted_text"][:10000]  # Limit size
-                    
-                    # Save events to database
-                    event_number = 1
-                    for _, row in df.iterrows():
-                        event = Event(
-                            run_id=run_id,
-                            document_id=doc.id,
-                            number=event_number,
-                            date=str(row.get("Date", "")),
-                            event_particulars=str(row.get("Event Particulars", "")),
-                            citation=str(row.get("Citation", "")),
-                            document_reference=doc.filename  # Use actual filename
-                        )
-                        db.add(event)
-                        event_number += 1
-                        total_events += 1
-                    
-                    # Update document status
-                    doc.status = DocumentStatus.SUCCESS
-                    doc.processed_at = datetime.utcnow()
-                    doc.processing_time_seconds = processing_time
-                    doc.pages = metadata.get("pages", 0) if metadata else 0
-                    doc.ocr_detected = metadata.get("ocr_detected", False) if metadata else False
-                    
-                    processed += 1
-                    logger.info(f"✅ Processed {doc.filename}: {len(df)} events extracted")
-                    
-            except Exception as e:
-                logger.error(f"❌ Failed to process {doc.filename}: {str(e)}")
-                doc.status = DocumentStatus.FAILED
-                doc.error = str(e)
-                failed += 1
-            
-            finally:
-                db.commit()
+                # Every document in the group gets its own copy of the events
+                pending = [(doc, result) for doc in group]
+                try:
+                    for doc, _ in pending:
+                        event_counts[doc.id] = _persist_doc_result(db, run_id, doc, result)
+                    batch.extend(pending)
+                except Exception as e:
+                    # The rollback discards the staged batch too; redo it one document at a time
+                    logger.warning(f"⚠️ Failed to stage {group[0].filename} ({e}) - saving batch individually")
+                    db.rollback()
+                    _save_docs_individually(db, run_id, batch + pending, event_counts)
+                    batch = []
+                    continue
+                
+                if len(batch) >= COMMIT_BATCH_SIZE:
+                    _commit_doc_batch(db, run_id, batch, event_counts)
+                    batch = []
+        finally:
+            # The shared executor outlives the run; drop documents still queued if it fails
+            for future in futures:
+                future.cancel()
+        
+        if batch:
+            _commit_doc_batch(db, run_id, batch, event_counts)
+        
+        processed = sum(1 for count in event_counts.values() if count is not None)
+        failed = total_docs - processed
+        total_events = sum(count for count in event_counts.values() if count is not None)
         
         # Calculate final status
         if processed == total_docs:
@@ -183,16 +542,11 @@ def process_run(run_id: int, provider: str = "openrouter", model: str = None) ->
         cost_per_million = 0.52  # Default for Llama 3.3 70B
         estimated_cost = (estimated_tokens / 1_000_000) * cost_per_million * 2  # Input + output
         
-        # Update run with final stats
-        run.status = final_status
-        run.finished_at = datetime.utcnow()
-        run.docling_seconds = total_docling_time
-        run.extractor_seconds = total_extractor_time
-        run.total_seconds = (run.finished_at - run.started_at).total_seconds()
-        run.cost_usd = estimated_cost
-        
-        # Add metadata
-        run.metadata = {
+        # Update run with final stats and metadata in one UPDATE (metadata is
+        # serialized once here instead of through ORM change tracking)
+        finished_at = datetime.utcnow()
+        total_seconds = (finished_at - run.started_at).total_seconds()
+        run_metadata = {
             "total_documents": total_docs,
             "processed": processed,
             "failed": failed,
@@ -200,7 +554,24 @@ def process_run(run_id: int, provider: str = "openrouter", model: str = None) ->
             "provider": provider,
             "model": model
         }
-        
+        db.execute(
+            text(
+                "UPDATE runs SET status = CAST(:status AS runstatus), finished_at = :finished_at, "
+                "docling_seconds = :docling_seconds, extractor_seconds = :extractor_seconds, "
+                "total_seconds = :total_seconds, cost_usd = :cost_usd, "
+                "metadata = CAST(:metadata AS JSONB) WHERE id = :run_id"
+            ),
+            {
+                "status": final_status.value,
+                "finished_at": finished_at,
+                "docling_seconds": total_docling_time,
+                "extractor_seconds": total_extractor_time,
+                "total_seconds": total_seconds,
+                "cost_usd": estimated_cost,
+                "metadata": _json_dumps(run_metadata).decode('utf-8'),
+                "run_id": run_id
+            }
+        )
         db.commit()
         
         # Generate artifacts (exports)
@@ -214,7 +585,7 @@ def process_run(run_id: int, provider: str = "openrouter", model: str = None) ->
             "processed": processed,
             "failed": failed,
             "total_events": total_events,
-            "duration_seconds": run.total_seconds
+            "duration_seconds": total_seconds
         }
         
     except Exception as e:
@@ -242,6 +613,9 @@ def process_document(
     """
     Process a single document (for retries or individual processing)
     
+    Always re-extracts the document; cached extractions are bypassed so a
+    retry never returns the result being retried.
+    
     Args:
         document_id: Document ID
         provider: LLM provider
@@ -251,7 +625,7 @@ def process_document(
         Result dictionary
     """
     db = SessionLocal()
-    storage = MinioStorage()
+    storage = get_storage()
     
     try:
         # Get document
@@ -261,51 +635,26 @@ def process_document(
         
         logger.info(f"📄 Processing single document: {doc.filename}")
         
-        # Initialize pipeline
-        pipeline = LegalEventsPipeline(
-            event_extractor=provider,
-            runtime_model=model
-        )
+        # Pipeline (reused across jobs for the same provider/model)
+        pipeline = _get_pipeline(provider, model)
         
         # Download and process
         with tempfile.NamedTemporaryFile(suffix=os.path.splitext(doc.filename)[1]) as tmp_file:
             storage.download_file(doc.storage_key, tmp_file.name)
             
-            # Create file wrapper
-            class FileWrapper:
-                def __init__(self, path, name):
-                    self.name = name
-                    self._path = path
-                
-                def getbuffer(self):
-                    with open(self._path, 'rb') as f:
-                        return f.read()
-            
-            file_obj = FileWrapper(tmp_file.name, doc.filename)
-            
-            # Process
-            df, metadata = pipeline.process_documents(
-                [file_obj],
-                case_name=f"Doc_{document_id}"
-            )
+            # Process (refreshing the cached extraction of the same file)
+            with FileWrapper(tmp_file.name, doc.filename) as file_obj:
+                df, metadata = _process_with_cache(
+                    pipeline, file_obj, storage, provider, model,
+                    case_name=f"Doc_{document_id}",
+                    use_cache=False
+                )
             
             # Delete existing events for this document
             db.query(Event).filter(Event.document_id == document_id).delete()
             
             # Save new events
-            event_number = 1
-            for _, row in df.iterrows():
-                event = Event(
-                    run_id=doc.run_id,
-                    document_id=document_id,
-                    number=event_number,
-                    date=str(row.get("Date", "")),
-                    event_particulars=str(row.get("Event Particulars", "")),
-                    citation=str(row.get("Citation", "")),
-                    document_reference=doc.filename
-                )
-                db.add(event)
-                event_number += 1
+            db.bulk_save_objects(_build_events(df, doc.run_id, document_id, doc.filename))
             
             # Update document
             doc.status = DocumentStatus.SUCCESS
@@ -339,6 +688,58 @@ def process_document(
         db.close()
 
 
+def _build_xlsx(df: pd.DataFrame, columns: Dict[str, list]) -> bytes:
+    """
+    Build the XLSX artifact with auto-sized column widths
+    
+    Uses xlsxwriter in constant_memory mode (rows are streamed out as they
+    are written) and falls back to openpyxl when xlsxwriter is missing.
+    
+    Args:
+        df: Export DataFrame
+        columns: The same data as column name -> list of values
+        
+    Returns:
+        Workbook bytes
+    """
+    # Width per column: longest value or header, plus padding, capped at 50
+    widths = [
+        min(max(max(map(len, map(str, values)), default=0), len(name)) + 2, 50)
+        for name, values in columns.items()
+    ]
+    xlsx_buffer = io.BytesIO()
+    
+    if XLSXWRITER_AVAILABLE:
+        # constant_memory only accepts cells on the current row, so rows are written directly
+        workbook = xlsxwriter.Workbook(xlsx_buffer, _XLSXWRITER_OPTIONS)
+        try:
+            worksheet = workbook.add_worksheet('Legal Events')
+            for col_idx, width in enumerate(widths):
+                worksheet.set_column(col_idx, col_idx, width)
+            
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            worksheet.write_row(0, 0, list(columns), header_format)
+            for row_idx, row in enumerate(zip(*columns.values()), start=1):
+                for col_idx, value in enumerate(row):
+                    if value is not None:
+                        worksheet.write(row_idx, col_idx, value)
+        finally:
+            workbook.close()
+        return xlsx_buffer.getvalue()
+    
+    from openpyxl.utils import get_column_letter
+    
+    with pd.ExcelWriter(xlsx_buffer, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Legal Events', index=False)
+        
+        # Auto-adjust column widths
+        worksheet = writer.sheets['Legal Events']
+        for col_idx, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+    
+    return xlsx_buffer.getvalue()
+
+
 def generate_artifacts(run_id: int) -> Dict[str, str]:
     """
     Generate export artifacts (CSV, XLSX, JSON) for a run
@@ -350,92 +751,82 @@ def generate_artifacts(run_id: int) -> Dict[str, str]:
         Dictionary of artifact types and their storage keys
     """
     db = SessionLocal()
-    storage = MinioStorage()
+    storage = get_storage()
     
     try:
-        # Get run and events
-        run = db.query(Run).filter(Run.id == run_id).first()
+        # Get run with its case and client (for storage paths) in one query
+        run = db.query(Run).options(
+            joinedload(Run.case).joinedload(Case.client)
+        ).filter(Run.id == run_id).first()
         if not run:
             raise ValueError(f"Run {run_id} not found")
         
-        events = db.query(Event).filter(Event.run_id == run_id).order_by(Event.number).all()
+        case = run.case
+        client = case.client
+        
+        # Only the five export columns are needed: select plain rows, not ORM objects
+        rows = db.execute(
+            select(
+                Event.number,
+                Event.date,
+                Event.event_particulars,
+                Event.citation,
+                Event.document_reference
+            ).where(Event.run_id == run_id).order_by(Event.number)
+        ).all()
         
-        if not events:
+        if not rows:
             logger.warning(f"No events found for run {run_id}")
             return {}
         
-        # Get case and client for path
-        case = db.query(Case).filter(Case.id == run.case_id).first()
-        client = db.query(Client).filter(Client.id == case.client_id).first()
-        
-        # Prepare data
-        data = []
-        for event in events:
-            data.append({
-                "No": event.number,
-                "Date": event.date,
-                "Event Particulars": event.event_particulars,
-                "Citation": event.citation,
-                "Document Reference": event.document_reference
-            })
-        
-        df = pd.DataFrame(data)
-        artifacts = {}
+        df = pd.DataFrame.from_records(rows, columns=FIVE_COLUMN_HEADERS)
+        columns = dict(zip(FIVE_COLUMN_HEADERS, map(list, zip(*rows))))
+        data = [dict(zip(FIVE_COLUMN_HEADERS, row)) for row in rows]
+        base_path = f"clients/{client.id}/cases/{case.id}/runs/{run_id}/artifacts/{run_id}"
         
         # Generate CSV
-        csv_path = f"clients/{client.id}/cases/{case.id}/runs/{run_id}/artifacts/{run_id}.csv"
-        csv_content = df.to_csv(index=False)
-        storage.upload_bytes(csv_path, csv_content.encode('utf-8'), "text/csv")
-        
-        artifact = Artifact(
-            run_id=run_id,
-            kind="csv",
-            storage_key=csv_path,
-            size_bytes=len(csv_content.encode('utf-8'))
-        )
-        db.add(artifact)
-        artifacts["csv"] = csv_path
+        csv_buffer = io.BytesIO()
+        df.to_csv(csv_buffer, index=False, encoding='utf-8')
+        csv_content = csv_buffer.getvalue()
         
         # Generate XLSX
-        import io
-        xlsx_path = f"clients/{client.id}/cases/{case.id}/runs/{run_id}/artifacts/{run_id}.xlsx"
-        xlsx_buffer = io.BytesIO()
-        
-        with pd.ExcelWriter(xlsx_buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Legal Events', index=False)
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Legal Events']
-            for column in df:
-                column_width = max(df[column].astype(str).map(len).max(), len(column))
-                col_idx = df.columns.get_loc(column)
-                worksheet.column_dimensions[chr(65 + col_idx)].width = min(column_width + 2, 50)
-        
-        xlsx_content = xlsx_buffer.getvalue()
-        storage.upload_bytes(xlsx_path, xlsx_content, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-        
-        artifact = Artifact(
-            run_id=run_id,
-            kind="xlsx",
-            storage_key=xlsx_path,
-            size_bytes=len(xlsx_content)
-        )
-        db.add(artifact)
-        artifacts["xlsx"] = xlsx_path
+        xlsx_content = _build_xlsx(df, columns)
         
         # Generate JSON
-        json_path = f"clients/{client.id}/cases/{case.id}/runs/{run_id}/artifacts/{run_id}.json"
-        json_content = json.dumps(data, indent=2)
-        storage.upload_bytes(json_path, json_content.encode('utf-8'), "application/json")
+        if ORJSON_AVAILABLE:
+            json_content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            json_content = json.dumps(data, indent=2).encode('utf-8')
+        
+        # (kind, storage key, content, content type)
+        outputs = [
+            ("csv", f"{base_path}.csv", csv_content, "text/csv"),
+            ("xlsx", f"{base_path}.xlsx", xlsx_content,
+             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+            ("json", f"{base_path}.json", json_content, "application/json"),
+        ]
+        
+        # Upload the three files concurrently (independent PUTs)
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            uploaded = list(executor.map(
+                lambda output: storage.upload_bytes(output[1], output[2], output[3]),
+                outputs
+            ))
         
-        artifact = Artifact(
-            run_id=run_id,
-            kind="json",
-            storage_key=json_path,
-            size_bytes=len(json_content.encode('utf-8'))
-        )
-        db.add(artifact)
-        artifacts["json"] = json_path
+        artifacts = {}
+        artifact_rows = []
+        for (kind, path, content, _), ok in zip(outputs, uploaded):
+            if not ok:
+                logger.warning(f"⚠️ {kind} artifact upload failed for run {run_id} - not recorded")
+                continue
+            artifact_rows.append(Artifact(
+                run_id=run_id,
+                kind=kind,
+                storage_key=path,
+                size_bytes=len(content)
+            ))
+            artifacts[kind] = path
+        db.bulk_save_objects(artifact_rows)
         
         db.commit()
         
@@ -461,33 +852,33 @@ def cleanup_old_runs(days: int = 90) -> int:
         Number of runs deleted
     """
     db = SessionLocal()
-    storage = MinioStorage()
+    storage = get_storage()
     
     try:
         from datetime import timedelta
         
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        # Find old runs
-        old_runs = db.query(Run).filter(Run.created_at < cutoff_date).all()
+        # Find old runs, with their case loaded for storage paths
+        old_runs = db.query(Run).options(joinedload(Run.case)).filter(Run.created_at < cutoff_date).all()
         
-        count = 0
+        # Storage prefix per run (runs without a case are skipped)
+        prefixes = {}
         for run in old_runs:
-            # Get case for storage paths
-            case = db.query(Case).filter(Case.id == run.case_id).first()
+            case = run.case
             if not case:
                 continue
-            
-            # Delete storage objects
-            prefix = f"clients/{case.client_id}/cases/{case.id}/runs/{run.id}/"
-            objects = storage.list_objects(prefix)
-            
-            for obj in objects:
-                storage.delete_object(obj)
-            
-            # Delete database records (cascades to documents, events, artifacts)
+            prefixes[run] = f"clients/{case.client_id}/cases/{case.id}/runs/{run.id}/"
+        
+        # Delete storage objects: one bulk delete per run, runs in parallel
+        if prefixes:
+            with ThreadPoolExecutor(max_workers=min(CLEANUP_CONCURRENCY, len(prefixes))) as executor:
+                list(executor.map(storage.delete_prefix, prefixes.values()))
+        
+        # Delete database records (cascades to documents, events, artifacts)
+        for run in prefixes:
             db.delete(run)
-            count += 1
+        count = len(prefixes)
         
         db.commit()
         